@@ -0,0 +1,158 @@
+"""
+Admission control for the write endpoints
+Per-client token buckets, a bounded in-flight budget and a queue-latency
+target, so a registration burst gets fast 429s instead of worker timeouts.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import request, session, jsonify
+
+# Tunables (set in Render Environment)
+ADMISSION_RATE = float(os.environ.get('ADMISSION_RATE', '5'))          # requests/second per client
+ADMISSION_BURST = float(os.environ.get('ADMISSION_BURST', '20'))       # bucket size per client
+ADMISSION_MAX_IN_FLIGHT = int(os.environ.get('ADMISSION_MAX_IN_FLIGHT', '8'))
+ADMISSION_QUEUE_TARGET_MS = float(os.environ.get('ADMISSION_QUEUE_TARGET_MS', '500'))
+ADMISSION_MAX_CLIENTS = 10000
+ADMISSION_TRUSTED_PROXIES = int(os.environ.get('ADMISSION_TRUSTED_PROXIES', '1'))  # Render's proxy appends one
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    def take(self):
+        """Take one token - returns seconds to wait if the bucket is empty, else 0"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / self.rate
+
+
+class AdmissionController:
+    def __init__(self, rate=ADMISSION_RATE, burst=ADMISSION_BURST,
+                 max_in_flight=ADMISSION_MAX_IN_FLIGHT, queue_target_ms=ADMISSION_QUEUE_TARGET_MS,
+                 max_clients=ADMISSION_MAX_CLIENTS):
+        self.rate = rate
+        self.burst = burst
+        self.queue_target = queue_target_ms / 1000.0
+        self.max_clients = max_clients
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._buckets = OrderedDict()  # client -> TokenBucket, least recently seen first
+        self._lock = threading.Lock()
+        self.admitted = 0
+        self.shed = {'rate_limited': 0, 'queue_latency': 0, 'in_flight': 0}
+
+    def admit(self, client, queued_for=0.0, shed=True):
+        """
+        Try to admit a request. Returns (reason, retry_after) when shedding,
+        or None once an in-flight slot has been taken (call release() after).
+        With shed=False only the client's rate limit applies and no slot is taken.
+        """
+        with self._lock:
+            bucket = self._buckets.pop(client, None) or TokenBucket(self.rate, self.burst)
+            self._buckets[client] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+            wait = bucket.take()
+        if wait:
+            return self._shed('rate_limited', wait)
+
+        if not shed:
+            with self._lock:
+                self.admitted += 1
+            return None
+
+        # Already waited too long in the server's accept queue - the client has likely given up
+        if queued_for > self.queue_target:
+            return self._shed('queue_latency', 1)
+
+        # Wait at most the remaining latency budget for an in-flight slot
+        if not self._slots.acquire(timeout=max(self.queue_target - queued_for, 0)):
+            return self._shed('in_flight', 1)
+
+        with self._lock:
+            self.admitted += 1
+        return None
+
+    def release(self):
+        self._slots.release()
+
+    def _shed(self, reason, retry_after):
+        with self._lock:
+            self.shed[reason] += 1
+        return reason, max(1, int(retry_after + 0.999))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'pid': os.getpid(),
+                'admitted': self.admitted,
+                'shed': dict(self.shed),
+                'tracked_clients': len(self._buckets)
+            }
+
+    def limit(self, view=None, shed=True):
+        """
+        Decorator: run `view` only if the request is admitted, otherwise 429 + Retry-After.
+        Use @limit(shed=False) for requests that close out work already admitted (ending a
+        visit, logging out) - those are never shed for load, only rate limited per client.
+        """
+        if view is None:
+            return lambda view: self.limit(view, shed)
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            rejected = self.admit(client_key(), queue_time(), shed)
+            if rejected:
+                reason, retry_after = rejected
+                response = jsonify({
+                    'success': False,
+                    'message': 'The roadshow is busy right now. Please try again in a few seconds.',
+                    'retry_after': retry_after
+                })
+                response.status_code = 429
+                response.headers['Retry-After'] = str(retry_after)
+                return response
+            if not shed:
+                return view(*args, **kwargs)
+            try:
+                return view(*args, **kwargs)
+            finally:
+                self.release()
+        return wrapper
+
+
+def client_key():
+    """Registered visitors are keyed by email; others by IP (venue Wi-Fi shares one, hence the large burst)"""
+    if session.get('email'):
+        return 'email:' + session['email'].lower()
+    # Only the entries our own proxies appended can be trusted - anything to their left is client-supplied
+    forwarded = [addr.strip() for addr in request.headers.get('X-Forwarded-For', '').split(',') if addr.strip()]
+    if ADMISSION_TRUSTED_PROXIES and len(forwarded) >= ADMISSION_TRUSTED_PROXIES:
+        return 'ip:' + forwarded[-ADMISSION_TRUSTED_PROXIES]
+    return 'ip:' + (request.remote_addr or '')
+
+
+def queue_time():
+    """Seconds this request waited before reaching us, from the proxy's X-Request-Start header"""
+    header = request.headers.get('X-Request-Start', '')
+    try:
+        started = float(header.replace('t=', '').strip())
+    except ValueError:
+        return 0.0
+    # Proxies send seconds, milliseconds or microseconds
+    if started > 1e14:
+        started /= 1e6
+    elif started > 1e11:
+        started /= 1e3
+    return max(time.time() - started, 0.0)
@@ -1,25 +1,51 @@
-from flask import Flask, render_template, request, jsonify, session, send_file
+from flask import Flask, Response, render_template, request, jsonify, session
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import escape
 import csv
+import itertools
 import os
 from datetime import datetime
 import secrets
 import re
 import io
-from zipfile import ZipFile
+import time
+from functools import wraps
+from importlib.util import find_spec
+from fragment_cache import FragmentCache, catalog_version
+from assets import init_assets
+from leaderboard import Leaderboard, LEADERBOARD_TTL
+from admission import AdmissionController
+from state_store import STATE_BACKEND, create_store
+from bulk_import import generate_badges, import_attendees
+from event_archive import EventArchive
+from background import background, badge_pool, export_pool, stream_zip
+from recovery_journal import RecoveryJournal
 
-# Try to use HTTP-based email service (works on Render)
-try:
-    from email_service import send_email_http
-    USE_HTTP_EMAIL = True
-except ImportError:
-    USE_HTTP_EMAIL = False
-    # Fallback to SMTP (won't work on Render but works locally)
-    import smtplib
-    from email.mime.text import MIMEText
-    from email.mime.multipart import MIMEMultipart
+# Use HTTP-based email service if `requests` is installed (works on Render).
+# Only probe for it here - the email stacks are imported on first send to keep cold starts fast.
+USE_HTTP_EMAIL = find_spec('requests') is not None
 
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
+# Set SECRET_KEY when running more than one instance so sessions are valid on every node
+app.secret_key = os.environ.get('SECRET_KEY') or secrets.token_hex(16)
+fragments = FragmentCache(app)
+assets = init_assets(app)
+admission = AdmissionController()
+
+# Shared secret for the admin endpoints that change state (set in Render Environment) - unset disables them
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+
+def admin_required(view):
+    """Decorator: run `view` only for requests carrying ADMIN_TOKEN (X-Admin-Token header or `token` form field)"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not ADMIN_TOKEN:
+            return jsonify({'success': False, 'message': 'Admin endpoints are disabled - set ADMIN_TOKEN'}), 403
+        supplied = request.headers.get('X-Admin-Token') or request.form.get('token', '')
+        if not secrets.compare_digest(supplied.encode('utf-8'), ADMIN_TOKEN.encode('utf-8')):
+            return jsonify({'success': False, 'message': 'Invalid admin token'}), 401
+        return view(*args, **kwargs)
+    return wrapper
 
 # Email Configuration (for SMTP fallback)
 try:
@@ -35,19 +61,63 @@ except ImportError:
 ENTRY_DATA_FILE = 'entry_data.csv'
 TIME_TRACKING_DIR = 'time_tracking'
 
-# Helper function to sanitize email for file naming
-def sanitize_email_for_filename(email):
-    """Convert email to safe filename (replace @ and . with _)"""
-    return email.replace('@', '_at_').replace('.', '_')
+# Email validation (compiled once, shared with bulk_import.py)
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+def init_storage():
+    """Create the time tracking directory and CSV headers if missing"""
+    # Ensure directories exist
+    os.makedirs(TIME_TRACKING_DIR, exist_ok=True)
+    
+    # Initialize CSV files if they don't exist
+    if not os.path.exists(ENTRY_DATA_FILE):
+        with open(ENTRY_DATA_FILE, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['Email', 'Entry Timestamp', 'Exit Timestamp'])
 
-# Ensure directories exist
-os.makedirs(TIME_TRACKING_DIR, exist_ok=True)
+def warmup(flask_app):
+    """Precompile every template and prime caches before accepting traffic"""
+    for name in flask_app.jinja_env.list_templates():
+        flask_app.jinja_env.get_template(name)
+    assets.prime()
+    
+    # Prime the fragment cache for every page in the catalog
+    with flask_app.test_request_context():
+        render_projects_page('', [])
+        for project_id in PROJECTS:
+            render_project_detail(project_id, False)
 
-# Initialize CSV files if they don't exist
-if not os.path.exists(ENTRY_DATA_FILE):
-    with open(ENTRY_DATA_FILE, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Email', 'Entry Timestamp', 'Exit Timestamp'])
+def create_app(run_warmup=None):
+    """
+    App factory for gunicorn: `gunicorn --preload "app:create_app()"`
+    
+    With --preload this runs once in the master, so forked workers share
+    the compiled templates (and the same secret key) instead of each
+    paying the cold start on their first request.
+    """
+    started = time.perf_counter()
+    init_storage()
+    
+    # Registrations and open visits from the last snapshot plus the journal tail
+    recovered = journal.recover()
+    print(f"[STARTUP] Recovered {recovered['snapshot_events'] + recovered['replayed']} journal events "
+          f"({recovered['replayed']} replayed) in {recovered['ms']:.1f} ms")
+    
+    # Seed the leaderboards from that state - with --preload, workers inherit it instead of
+    # each replaying the whole journal on their first /leaderboard
+    if STATE_BACKEND == 'file':
+        leaderboard.prime(*journal.completed_visits())
+    
+    if run_warmup is None:
+        run_warmup = os.environ.get('APP_WARMUP', '1') == '1'
+    if run_warmup:
+        warmup(app)
+    if qr_scanner_url() == QR_SCANNER_CDN_URL:
+        print(f"[STARTUP] ⚠️ static/{QR_SCANNER_VENDOR_FILE} missing - QR scanner loads from the CDN "
+              f"(run python vendor_assets.py and commit the file)")
+    
+    print(f"[STARTUP] App ready in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return app
 
 # Project configuration
 PROJECTS = {
@@ -59,6 +129,60 @@ PROJECTS = {
     '6': {'name': 'Martech', 'estimated_time': '15 minutes'}
 }
 
+# Registrations, visits and counters (CSV files by default, Redis when STATE_BACKEND=redis)
+store = create_store(ENTRY_DATA_FILE, TIME_TRACKING_DIR, PROJECTS)
+
+# Write-ahead journal of check-ins and visits for crash recovery (see recovery_journal.py)
+journal = RecoveryJournal()
+
+# Event-wide leaderboards (shared across workers via the journal's completed visits;
+# with Redis, RedisStore.leaderboard() serves them from sorted sets shared by all instances)
+leaderboard = Leaderboard(journal.path, PROJECTS)
+
+# Columnar archive of past events (see event_archive.py)
+event_archive = EventArchive()
+
+def open_visit_start(email, project_id):
+    """Start time of an unfinished visit, for when the visitor's session lost it"""
+    if STATE_BACKEND == 'file':
+        return journal.open_visit(email, project_id)
+    # Redis holds every instance's open visits - the journal only sees this one
+    return store.active_visits(email).get(project_id)
+
+def render_projects_page(employee_name, completed_projects):
+    """Render projects.html from the fragment cache with this visitor's slots"""
+    return fragments.render(
+        'projects.html',
+        catalog_version(PROJECTS),
+        {'projects': PROJECTS},
+        {
+            'employee_name': escape(employee_name),
+            'completed_projects_json': htmlsafe_json_dumps(completed_projects)
+        })
+
+# QR scanner library - self-hosted copy (see vendor_assets.py), pinned CDN build as fallback
+QR_SCANNER_VENDOR_FILE = 'vendor/html5-qrcode.min.js'
+QR_SCANNER_CDN_URL = 'https://unpkg.com/html5-qrcode@2.3.8/html5-qrcode.min.js'
+
+def qr_scanner_url():
+    """URL the project page lazy-loads the QR scanner from"""
+    if os.path.exists(os.path.join(app.static_folder, QR_SCANNER_VENDOR_FILE)):
+        return assets.url(QR_SCANNER_VENDOR_FILE)
+    return QR_SCANNER_CDN_URL
+
+def render_project_detail(project_id, show_scan_prompt):
+    """Render project_detail.html from the fragment cache with this visitor's slots"""
+    return fragments.render(
+        'project_detail.html',
+        (project_id, catalog_version(PROJECTS)),
+        {
+            'project_id': project_id,
+            'project': PROJECTS[project_id],
+            'is_registered': True,
+            'qr_scanner_url': qr_scanner_url()
+        },
+        {'show_scan_prompt_json': htmlsafe_json_dumps(show_scan_prompt)})
+
 @app.route('/')
 def index():
     """Welcome page with entry form"""
@@ -70,6 +194,7 @@ def image_mapper():
     return render_template('image_mapper.html')
 
 @app.route('/submit-entry', methods=['POST'])
+@admission.limit
 def submit_entry():
     """Handle employee entry data submission"""
     data = request.json
@@ -79,17 +204,14 @@ def submit_entry():
         return jsonify({'success': False, 'message': 'Email is required'}), 400
     
     # Validate email format
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not EMAIL_PATTERN.match(email):
         return jsonify({'success': False, 'message': 'Invalid email format. Please enter a valid email address.'}), 400
     
-    # Check for duplicate email
-    if os.path.exists(ENTRY_DATA_FILE):
-        with open(ENTRY_DATA_FILE, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['Email'].lower() == email.lower():
-                    return jsonify({'success': False, 'message': 'This Email ID has already been registered.'}), 400
+    # Register - duplicate check and insert happen together in the store
+    entry_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if not store.register(email, entry_timestamp):
+        return jsonify({'success': False, 'message': 'This Email ID has already been registered.'}), 400
+    journal.register(email, entry_timestamp)
     
     # Save to session (use email as the unique identifier)
     session['email'] = email
@@ -99,12 +221,6 @@ def submit_entry():
     if 'project_times' not in session:
         session['project_times'] = {}
     
-    # Log entry data to CSV (exit time will be updated on logout)
-    entry_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    with open(ENTRY_DATA_FILE, 'a', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow([email, entry_timestamp, ''])
-    
     # Check if there's an intended project to redirect to
     intended_project = session.pop('intended_project', None)
     
@@ -119,17 +235,11 @@ def projects():
     if 'email' not in session:
         return render_template('index.html')
     
-    # Get project times from session
-    project_times = session.get('project_times', {})
-    
     # Get completed projects from session
     completed_projects = session.get('completed_projects', [])
     
-    return render_template('projects.html', 
-                         projects=PROJECTS,
-                         employee_name=session.get('email'),
-                         project_times=project_times,
-                         completed_projects=completed_projects)
+    # Static page is cached per catalog version - only the visitor's slots are filled in here
+    return render_projects_page(session.get('email'), completed_projects)
 
 @app.route('/projects-test')
 def projects_test():
@@ -167,19 +277,14 @@ def project_detail(project_id):
     if project_id not in PROJECTS:
         return "Project not found", 404
     
-    project = PROJECTS[project_id]
-    
     # Check if they just registered and scanned a QR
     scanned_verify = session.pop('scanned_verify_id', None)
     show_scan_prompt = (scanned_verify == project_id)
     
-    return render_template('project_detail.html', 
-                         project_id=project_id,
-                         project=project,
-                         is_registered=True,
-                         show_scan_prompt=show_scan_prompt)
+    return render_project_detail(project_id, show_scan_prompt)
 
 @app.route('/start-project/<project_id>', methods=['POST'])
+@admission.limit
 def start_project(project_id):
     """Record start time when QR is scanned at project - MUST be registered"""
     # Security check: Must be registered
@@ -196,10 +301,13 @@ def start_project(project_id):
     
     session['project_start_times'][project_id] = start_time
     session.modified = True
+    store.start_visit(session['email'], project_id, start_time)
+    journal.start_visit(session['email'], project_id, start_time)
     
     return jsonify({'success': True, 'start_time': start_time})
 
 @app.route('/end-project/<project_id>', methods=['POST'])
+@admission.limit(shed=False)
 def end_project(project_id):
     """Calculate time spent when user returns to main menu"""
     if 'email' not in session:
@@ -208,11 +316,12 @@ def end_project(project_id):
     if project_id not in PROJECTS:
         return jsonify({'success': False, 'message': 'Invalid project'}), 400
     
-    # Get start time
-    if 'project_start_times' not in session or project_id not in session['project_start_times']:
+    # Get start time - fall back to the recorded visit if the session lost it (e.g. a crash mid-request)
+    start_iso = session.get('project_start_times', {}).get(project_id) or open_visit_start(session['email'], project_id)
+    if not start_iso:
         return jsonify({'success': False, 'message': 'Project not started'}), 400
     
-    start_time = datetime.fromisoformat(session['project_start_times'][project_id])
+    start_time = datetime.fromisoformat(start_iso)
     end_time = datetime.now()
     time_spent = (end_time - start_time).total_seconds() / 60  # Convert to minutes
     
@@ -230,10 +339,13 @@ def end_project(project_id):
         session['completed_projects'].append(project_id)
     session.modified = True
     
-    # Save to CSV file for this employee with timestamps
+    # Journal the visit (this also feeds the leaderboards) and save to CSV file for this
+    # employee with timestamps - both land in the same group commit
+    journal_committed = journal.end_visit(session['email'], project_id, round(time_spent, 2), wait=False)
     start_time_str = start_time.strftime('%Y-%m-%d %H:%M:%S')
     end_time_str = end_time.strftime('%Y-%m-%d %H:%M:%S')
-    save_time_tracking(session['email'], project_id, start_time_str, end_time_str)
+    store.end_visit(session['email'], project_id, start_time_str, end_time_str, round(time_spent, 2))
+    journal_committed()
     
     return jsonify({
         'success': True, 
@@ -241,73 +353,6 @@ def end_project(project_id):
         'project_name': PROJECTS[project_id]['name']
     })
 
-def update_exit_time(email):
-    """Update exit timestamp for employee in entry_data.csv"""
-    if not os.path.exists(ENTRY_DATA_FILE):
-        return
-    
-    exit_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    # Read all rows
-    rows = []
-    with open(ENTRY_DATA_FILE, 'r', newline='') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
-        for row in reader:
-            if row['Email'].lower() == email.lower():
-                row['Exit Timestamp'] = exit_timestamp
-            rows.append(row)
-    
-    # Write back all rows
-    with open(ENTRY_DATA_FILE, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-def save_time_tracking(email, project_id, entry_time, exit_time):
-    """Save time tracking data to employee-specific CSV file with timestamps"""
-    safe_filename = sanitize_email_for_filename(email)
-    file_path = os.path.join(TIME_TRACKING_DIR, f'{safe_filename}_time_tracking.csv')
-    
-    print(f"[DEBUG] Saving time tracking for {email}, Project {project_id}")
-    print(f"[DEBUG] Entry: {entry_time}, Exit: {exit_time}")
-    print(f"[DEBUG] File path: {file_path}")
-    
-    # Check if file exists
-    file_exists = os.path.exists(file_path)
-    
-    # Read existing data if file exists
-    project_data = {}
-    if file_exists:
-        with open(file_path, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                project_data = row
-                break
-    
-    # Update project timestamps
-    project_name = PROJECTS[project_id]['name']
-    entry_key = f'{project_name} Entry Time'
-    exit_key = f'{project_name} Exit Time'
-    project_data['Email'] = email
-    project_data[entry_key] = entry_time
-    project_data[exit_key] = exit_time
-    
-    # Write updated data
-    fieldnames = ['Email', 
-                  'PMO Entry Time', 'PMO Exit Time',
-                  'Data & Governance Entry Time', 'Data & Governance Exit Time',
-                  'Analytics & Reporting Entry Time', 'Analytics & Reporting Exit Time',
-                  'Machine Learning Solutions Entry Time', 'Machine Learning Solutions Exit Time',
-                  'Consumer Research & Insights Entry Time', 'Consumer Research & Insights Exit Time',
-                  'Martech Entry Time', 'Martech Exit Time']
-    with open(file_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerow(project_data)
-    
-    print(f"[DEBUG] Successfully saved to {file_path}")
-
 @app.route('/get-session-data')
 def get_session_data():
     """Get current session data for debugging"""
@@ -569,9 +614,14 @@ def send_summary_email(employee_email, entry_time, project_times):
         
         # Use HTTP-based email if available (works on Render), otherwise fallback to SMTP
         if USE_HTTP_EMAIL:
+            from email_service import send_email_http
             return send_email_http(employee_email, subject, html_body)
         else:
             # SMTP fallback (for local development only - won't work on Render)
+            import smtplib
+            from email.mime.text import MIMEText
+            from email.mime.multipart import MIMEMultipart
+            
             msg = MIMEMultipart('alternative')
             msg['Subject'] = subject
             msg['From'] = EMAIL_SENDER
@@ -597,6 +647,7 @@ def send_summary_email(employee_email, entry_time, project_times):
         return False
 
 @app.route('/logout', methods=['POST'])
+@admission.limit(shed=False)
 def logout():
     """Handle logout, update exit time in CSV, and send summary email"""
     try:
@@ -607,16 +658,22 @@ def logout():
         
         # Update exit time in entry_data.csv
         if employee_email:
-            update_exit_time(employee_email)
+            exit_timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            store.mark_exit(employee_email, exit_timestamp)
+            journal.exit(employee_email, exit_timestamp)
         
-        # Send email if we have an email address (with timeout to prevent hanging)
+        # Send email if we have an email address - in the background so a slow
+        # mail API doesn't hold this request; inline only if the pool is saturated
         email_sent = False
+        email_queued = False
         if employee_email and entry_time:
-            try:
-                email_sent = send_summary_email(employee_email, entry_time, project_times)
-            except Exception as email_error:
-                print(f"Email sending failed (non-critical): {str(email_error)}")
-                email_sent = False
+            email_queued = background.submit(send_summary_email, employee_email, entry_time, project_times) is not None
+            if not email_queued:
+                try:
+                    email_sent = send_summary_email(employee_email, entry_time, project_times)
+                except Exception as email_error:
+                    print(f"Email sending failed (non-critical): {str(email_error)}")
+                    email_sent = False
         
         # Clear session
         session.clear()
@@ -624,7 +681,8 @@ def logout():
         return jsonify({
             'success': True,
             'email_sent': email_sent,
-            'message': 'Logged out successfully' + (' - Email sent!' if email_sent else '')
+            'email_queued': email_queued,
+            'message': 'Logged out successfully' + (' - Email sent!' if email_sent else ' - Email on its way!' if email_queued else '')
         })
     except Exception as e:
         # Clear session anyway
@@ -637,37 +695,26 @@ def logout():
 @app.route('/admin-download-csv')
 def admin_download_csv():
     """ADMIN ONLY: Download all CSV data as ZIP file"""
+    # Stream the ZIP while a background thread writes it (master entry/exit
+    # CSV plus every employee's time tracking CSV) instead of buffering it all
+    export = stream_zip(export_pool, store.export)
     try:
-        # Create in-memory ZIP file
-        memory_file = io.BytesIO()
-        
-        with ZipFile(memory_file, 'w') as zf:
-            # Add entry_data.csv (master file with entry/exit times)
-            if os.path.exists(ENTRY_DATA_FILE):
-                with open(ENTRY_DATA_FILE, 'rb') as f:
-                    zf.writestr('master_entry_exit_times.csv', f.read())
-            
-            # Add all employee time tracking files
-            if os.path.exists(TIME_TRACKING_DIR):
-                for filename in os.listdir(TIME_TRACKING_DIR):
-                    if filename.endswith('_time_tracking.csv'):
-                        file_path = os.path.join(TIME_TRACKING_DIR, filename)
-                        with open(file_path, 'rb') as f:
-                            zf.writestr(f'modules/{filename}', f.read())
-        
-        # Prepare download
-        memory_file.seek(0)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        return send_file(
-            memory_file,
-            mimetype='application/zip',
-            as_attachment=True,
-            download_name=f'roadshow_admin_data_{timestamp}.zip'
-        )
-        
+        # Wait for the first chunk so a failing export still gets a JSON 500, not a truncated ZIP
+        chunks = iter(export)
+        first = next(chunks, b'')
     except Exception as e:
+        export.close()
         return jsonify({'success': False, 'message': f'Error generating CSV files: {str(e)}'}), 500
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    response = Response(
+        itertools.chain([first], chunks),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename=roadshow_admin_data_{timestamp}.zip'}
+    )
+    # Runs when the server is done with the response - even if the client left before reading it
+    response.call_on_close(export.close)
+    return response
 
 @app.route('/get-project-times')
 def get_project_times():
@@ -701,5 +748,83 @@ def get_project_times():
     
     return jsonify({'times': times_list})
 
+@app.route('/admin-import', methods=['POST'])
+@admin_required
+def admin_import():
+    """ADMIN ONLY: Bulk pre-register invitees from an uploaded CSV (streamed in chunks)"""
+    upload = request.files.get('file')
+    if not upload:
+        return jsonify({'success': False, 'message': 'CSV file is required'}), 400
+    
+    # Badges are CPU-heavy - queue them per chunk instead of rendering inside this request
+    badges = {'badges_queued': 0, 'badges_not_queued': 0}
+    def queue_badges(added):
+        if badge_pool.submit(generate_badges, added) is None:
+            badges['badges_not_queued'] += len(added)
+        else:
+            badges['badges_queued'] += len(added)
+    
+    try:
+        lines = io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline='')
+        summary = import_attendees(lines, store, EMAIL_PATTERN,
+                                   on_added=queue_badges if request.args.get('badges') == '1' else None)
+        if badges['badges_not_queued']:
+            summary['message'] = f"Badge queue is full - {badges['badges_not_queued']} badges were not generated"
+        return jsonify({'success': True, **summary, **badges})
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'Error importing CSV: {str(e)}'}), 500
+
+@app.route('/admin-archive', methods=['POST'])
+@admin_required
+def admin_archive():
+    """ADMIN ONLY: Archive the current event as a columnar partition"""
+    try:
+        meta = event_archive.archive(store, PROJECTS, request.args.get('date'))
+        return jsonify({'success': True, **meta})
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'Error archiving event: {str(e)}'}), 500
+
+@app.route('/admin-season-stats')
+def admin_season_stats():
+    """ADMIN ONLY: Average dwell per project and attendance across archived events"""
+    try:
+        return jsonify({
+            'success': True,
+            'average_dwell': event_archive.average_dwell_per_project(),
+            'attendance': event_archive.attendance()
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': f'Error reading archive: {str(e)}'}), 500
+
+@app.route('/event-stats')
+def event_stats():
+    """ADMIN ONLY: Registration and visit counters from the state store"""
+    return jsonify(store.counters())
+
+@app.route('/admission-stats')
+def admission_stats():
+    """ADMIN ONLY: Admitted and shed request counts for this worker"""
+    return jsonify(admission.stats())
+
+@app.route('/recovery-stats')
+def recovery_stats():
+    """ADMIN ONLY: Live state rebuilt from this instance's journal - check-ins, open visits, per-project totals"""
+    return jsonify(journal.stats())
+
+@app.route('/leaderboard')
+def get_leaderboard():
+    """Event-wide leaderboards: most booths completed, longest total dwell, top visitors per project"""
+    if STATE_BACKEND == 'file':
+        response = jsonify(leaderboard.snapshot())
+    else:
+        response = jsonify(store.leaderboard())
+    
+    # Phones poll this - let them (and any proxy) reuse it for the refresh interval
+    response.cache_control.public = True
+    response.cache_control.max_age = int(LEADERBOARD_TTL)
+    return response
+
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    create_app().run(host='0.0.0.0', port=5000, debug=True)
@@ -0,0 +1,59 @@
+"""
+Fingerprinted static assets
+Templates link CSS/JS bundles through asset_url(), which appends a content
+hash so the browser can cache them for a year and still pick up new deploys.
+"""
+import hashlib
+import os
+
+from flask import request, url_for
+
+# One year - the fingerprint changes whenever the file does
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+
+class AssetManifest:
+    """Content hashes of files under the static folder, recomputed when a file changes"""
+
+    def __init__(self, static_folder):
+        self.static_folder = static_folder
+        self._hashes = {}  # filename -> (mtime, hash)
+
+    def fingerprint(self, filename):
+        path = os.path.join(self.static_folder, filename)
+        mtime = os.path.getmtime(path)
+        cached = self._hashes.get(filename)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                digest = hashlib.md5(f.read()).hexdigest()[:10]
+            cached = (mtime, digest)
+            self._hashes[filename] = cached
+        return cached[1]
+
+    def url(self, filename):
+        """Static URL for `filename` with its content fingerprint"""
+        return url_for('static', filename=filename, v=self.fingerprint(filename))
+
+    def prime(self):
+        """Hash every static file up front (used by warmup)"""
+        for root, _, files in os.walk(self.static_folder):
+            for name in files:
+                filename = os.path.relpath(os.path.join(root, name), self.static_folder)
+                self.fingerprint(filename.replace(os.sep, '/'))
+
+
+def init_assets(app):
+    """Register asset_url() for templates and long-lived cache headers for fingerprinted files"""
+    manifest = AssetManifest(app.static_folder)
+
+    @app.after_request
+    def cache_fingerprinted_assets(response):
+        if request.endpoint == 'static' and request.args.get('v') and response.status_code == 200:
+            response.cache_control.public = True
+            response.cache_control.max_age = ASSET_MAX_AGE
+            response.cache_control.immutable = True
+            response.cache_control.no_cache = None
+        return response
+
+    app.add_template_global(manifest.url, name='asset_url')
+    return manifest
@@ -0,0 +1,149 @@
+"""
+Bounded background thread pool for slow I/O
+Email sends and ZIP exports run here so a slow mail API or a large export
+never pins a request thread for its whole duration.
+"""
+import io
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+BACKGROUND_WORKERS = int(os.environ.get('BACKGROUND_WORKERS', '4'))
+BACKGROUND_MAX_PENDING = int(os.environ.get('BACKGROUND_MAX_PENDING', '64'))
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class BoundedExecutor:
+    """ThreadPoolExecutor that refuses work (returns None) instead of queueing without limit"""
+
+    def __init__(self, max_workers=BACKGROUND_WORKERS, max_pending=BACKGROUND_MAX_PENDING):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='background')
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+
+    def submit(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            return None
+        future = self._executor.submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+
+class _StreamCancelled(Exception):
+    pass
+
+
+def _put(chunks, item, cancelled):
+    """Queue `item` for the consumer, giving up if the client has gone away"""
+    while not cancelled.is_set():
+        try:
+            chunks.put(item, timeout=1)
+            return
+        except queue.Full:
+            continue
+    raise _StreamCancelled()
+
+
+class _QueueWriter(io.RawIOBase):
+    """Write-only stream that hands chunks to the response generator"""
+
+    def __init__(self, chunks, cancelled):
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._buffer = bytearray()
+        self._discarding = False
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self._discarding:
+            return len(data)
+        self._buffer += data
+        if len(self._buffer) >= STREAM_CHUNK_SIZE:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self._buffer:
+            _put(self._chunks, bytes(self._buffer), self._cancelled)
+            self._buffer.clear()
+
+    def discard(self):
+        """Drop everything from here on (the build failed - don't send a half-valid archive)"""
+        self._discarding = True
+        self._buffer.clear()
+
+
+class ZipStream:
+    """
+    ZIP archive produced by build(zipfile) while it is being written.
+    The build runs on `executor`; a bounded queue applies back-pressure.
+    Iterate for the chunks; close() stops the build if the download is abandoned.
+    """
+
+    def __init__(self, executor, build):
+        self._chunks = queue.Queue(maxsize=16)
+        self._cancelled = threading.Event()
+        self._build = build
+        self._done = object()
+        self._inline = executor.submit(self._produce) is None
+
+    def _produce(self):
+        from zipfile import ZipFile, ZIP_DEFLATED
+
+        try:
+            writer = _QueueWriter(self._chunks, self._cancelled)
+            zf = ZipFile(writer, 'w', ZIP_DEFLATED)
+            try:
+                self._build(zf)
+            except BaseException:
+                writer.discard()
+                zf.close()
+                raise
+            zf.close()
+            writer.flush()
+            _put(self._chunks, self._done, self._cancelled)
+        except _StreamCancelled:
+            pass
+        except Exception as e:
+            try:
+                _put(self._chunks, e, self._cancelled)
+            except _StreamCancelled:
+                pass
+
+    def __iter__(self):
+        if self._inline:
+            # Pool is saturated - build inline instead
+            from zipfile import ZipFile, ZIP_DEFLATED
+
+            memory_file = io.BytesIO()
+            with ZipFile(memory_file, 'w', ZIP_DEFLATED) as zf:
+                self._build(zf)
+            yield memory_file.getvalue()
+            return
+
+        try:
+            while True:
+                chunk = self._chunks.get()
+                if chunk is self._done:
+                    return
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self):
+        # Unblocks the producer if the download was abandoned (or never started)
+        self._cancelled.set()
+
+
+def stream_zip(executor, build):
+    return ZipStream(executor, build)
+
+
+# Shared pools used by app.py - exports and badge jobs get their own so they never queue behind emails
+background = BoundedExecutor()
+export_pool = BoundedExecutor(max_workers=2, max_pending=2)
+badge_pool = BoundedExecutor(max_workers=1, max_pending=16)
@@ -0,0 +1,132 @@
+"""
+Serving benchmark: sync vs threaded gunicorn workers
+Starts the app under each worker class against a throwaway data directory and
+drives it with concurrent simulated attendees (register, browse, visit a
+team, leaderboard, logout) plus periodic admin exports.
+"""
+
+import http.cookiejar
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ATTENDEES = int(os.environ.get('BENCH_ATTENDEES', '200'))
+CONCURRENCY = int(os.environ.get('BENCH_CONCURRENCY', '50'))
+WORKERS = os.environ.get('BENCH_WORKERS', '2')
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(worker_class, port, data_dir):
+    env = dict(os.environ,
+               GUNICORN_WORKER_CLASS=worker_class,
+               WEB_CONCURRENCY=WORKERS,
+               SECRET_KEY='bench',
+               ADMISSION_BURST='100000',
+               PYTHONPATH=APP_DIR)
+    server = subprocess.Popen(
+        ['gunicorn', '-c', os.path.join(APP_DIR, 'gunicorn.conf.py'), '--chdir', data_dir,
+         '--bind', f'127.0.0.1:{port}', 'app:create_app()'],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/', timeout=1)
+            return server
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError(f'gunicorn ({worker_class}) did not start')
+
+
+def attendee(base, i, latencies):
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def call(path, payload=None):
+        # GET without a payload, JSON POST with one
+        data = json.dumps(payload).encode() if payload is not None else None
+        request = urllib.request.Request(base + path, data=data, headers={'Content-Type': 'application/json'})
+        started = time.perf_counter()
+        try:
+            opener.open(request, timeout=60).read()
+        except urllib.error.HTTPError as e:
+            e.read()
+        latencies.append(time.perf_counter() - started)
+
+    call('/submit-entry', {'email': f'bench{i}@cable.comcast.com'})
+    call('/projects')
+    call('/start-project/1', {})
+    call('/end-project/1', {})
+    call('/leaderboard')
+    call('/logout', {})
+    if i % 50 == 0:
+        call('/admin-download-csv')
+
+
+def run(worker_class):
+    data_dir = tempfile.mkdtemp(prefix='roadshow-bench-')
+    port = free_port()
+    server = start_server(worker_class, port, data_dir)
+    latencies = []
+    pending = list(range(ATTENDEES))
+    lock = threading.Lock()
+
+    def client():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                i = pending.pop()
+            attendee(f'http://127.0.0.1:{port}', i, latencies)
+
+    try:
+        started = time.perf_counter()
+        threads = [threading.Thread(target=client) for _ in range(CONCURRENCY)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'seconds': elapsed,
+        'rps': len(latencies) / elapsed,
+        'p50': latencies[len(latencies) // 2] * 1000,
+        'p95': latencies[int(len(latencies) * 0.95)] * 1000,
+    }
+
+
+def main():
+    if shutil.which('gunicorn') is None:
+        sys.exit('gunicorn is required (pip install -r requirements.txt)')
+
+    print("🚀 EBI Roadshow serving benchmark")
+    print(f"   {ATTENDEES} attendees, {CONCURRENCY} concurrent, {WORKERS} workers")
+    print("=" * 50)
+    for worker_class in ('sync', 'gthread'):
+        result = run(worker_class)
+        print(f"\n{worker_class}:")
+        print(f"   {result['requests']} requests in {result['seconds']:.1f}s ({result['rps']:.0f} req/s)")
+        print(f"   p50 {result['p50']:.1f} ms, p95 {result['p95']:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
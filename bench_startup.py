@@ -0,0 +1,72 @@
+"""
+Cold-start benchmark for the roadshow app
+Measures `import app`, create_app() and the first request, each in a fresh
+interpreter so nothing is already cached.
+"""
+
+import os
+import subprocess
+import sys
+
+RUNS = int(os.environ.get('BENCH_RUNS', '5'))
+
+PROBE = r"""
+import time
+t0 = time.perf_counter()
+import app as m
+t1 = time.perf_counter()
+m.create_app(run_warmup={warmup})
+t2 = time.perf_counter()
+client = m.app.test_client()
+client.get('/')
+t3 = time.perf_counter()
+print(f"{{(t1 - t0) * 1000:.1f}} {{(t2 - t1) * 1000:.1f}} {{(t3 - t2) * 1000:.1f}}")
+"""
+
+
+def run_probe(warmup):
+    """Run one cold start in a subprocess and return (import, create, first request) in ms"""
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE.format(warmup=warmup)],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    return [float(x) for x in result.stdout.strip().splitlines()[-1].split()]
+
+
+def top_imports(limit=10):
+    """Slowest modules imported by `import app` (python -X importtime)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = [part.strip() for part in line.split('|')]
+        rows.append((int(cumulative_us), name))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main():
+    print("🚀 EBI Roadshow cold-start benchmark")
+    print("=" * 50)
+
+    for warmup in (False, True):
+        samples = [run_probe(warmup) for _ in range(RUNS)]
+        avg = [sum(col) / len(col) for col in zip(*samples)]
+        label = 'with warmup' if warmup else 'no warmup'
+        print(f"\n{label} (avg of {RUNS}):")
+        print(f"   import app:    {avg[0]:8.1f} ms")
+        print(f"   create_app():  {avg[1]:8.1f} ms")
+        print(f"   first request: {avg[2]:8.1f} ms")
+
+    print("\nSlowest imports (cumulative):")
+    for cumulative_us, name in top_imports():
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
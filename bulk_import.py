@@ -0,0 +1,144 @@
+"""
+Bulk pre-registration import for EBI Comcast Roadshow
+Streams a large invitee CSV in chunks, validates and deduplicates emails,
+bulk-inserts them into the registration store and (optionally) pre-generates
+personalized badge QR codes for the newly added invitees - in parallel
+processes from the CLI, as a queued background job from /admin-import
+(which requires the ADMIN_TOKEN shared secret in an X-Admin-Token header).
+
+Usage: python bulk_import.py invitees.csv [--badges] [--chunk-size 5000]
+"""
+
+import argparse
+import csv
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
+
+from state_store import sanitize_email_for_filename
+
+IMPORT_CHUNK_SIZE = 5000
+BADGE_DIR = 'badges'
+
+
+def iter_chunks(lines, chunk_size=IMPORT_CHUNK_SIZE):
+    """Yield lists of raw email strings from a CSV stream, `chunk_size` rows at a time"""
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+
+    # Use the "Email" column if there is a header, otherwise the first column
+    lowered = [column.strip().lower() for column in header]
+    if 'email' in lowered:
+        column = lowered.index('email')
+        chunk = []
+    else:
+        column = 0
+        chunk = [header[0]] if header else []
+
+    for row in reader:
+        if len(row) > column:
+            chunk.append(row[column])
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def badge_filename(email):
+    return os.path.join(BADGE_DIR, f'{sanitize_email_for_filename(email)}.png')
+
+
+def generate_badge(args):
+    """Worker: one personalized badge (QR pre-fills the entrance form)"""
+    from generate_qr import generate_qr_code
+    email, server_url = args
+    return generate_qr_code(f"{server_url}/?email={quote(email)}", badge_filename(email), email, quiet=True)
+
+
+def badge_jobs(emails, server_url=None):
+    """(email, server_url) pairs for generate_badge, creating the badge directory"""
+    from generate_qr import QR_DIR, SERVER_URL
+    os.makedirs(os.path.join(QR_DIR, BADGE_DIR), exist_ok=True)
+    return [(email, server_url or SERVER_URL) for email in emails]
+
+
+def generate_badges(emails, server_url=None):
+    """Badges for `emails`, one after another in the calling thread - the job /admin-import queues"""
+    for job in badge_jobs(emails, server_url):
+        generate_badge(job)
+    print(f"✅ Generated {len(emails)} badges")
+    return len(emails)
+
+
+def import_attendees(lines, store, email_pattern, chunk_size=IMPORT_CHUNK_SIZE, on_added=None):
+    """
+    Import invitees from CSV text `lines` into `store`.
+    Memory stays bounded by `chunk_size`; on_added(emails) is called with each
+    chunk's newly added invitees (not duplicates). Returns a summary dict.
+    """
+    summary = {'rows': 0, 'imported': 0, 'duplicates': 0, 'invalid': 0}
+    for chunk in iter_chunks(lines, chunk_size):
+        summary['rows'] += len(chunk)
+        valid = []
+        for email in chunk:
+            email = email.strip()
+            if email_pattern.match(email):
+                valid.append(email)
+            else:
+                summary['invalid'] += 1
+
+        added = store.preregister_many(valid)
+        summary['imported'] += len(added)
+        summary['duplicates'] += len(valid) - len(added)
+        if on_added and added:
+            on_added(added)
+
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk-import pre-registered invitees from a CSV file')
+    parser.add_argument('csv_file', help='CSV with an "Email" column (or emails in the first column)')
+    parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument('--badges', action='store_true', help='also generate badge QR codes')
+    parser.add_argument('--server-url', help='URL encoded in badge QR codes')
+    parser.add_argument('--workers', type=int, help='badge generator processes (default: CPU count)')
+    args = parser.parse_args()
+
+    # Use the same store and validation as the running app
+    from app import store, EMAIL_PATTERN, init_storage
+    init_storage()
+
+    print("🚀 EBI Comcast Roadshow Bulk Import")
+    print("=" * 50)
+    started = time.perf_counter()
+    badges = 0
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.badges else None
+
+    def make_badges(added):
+        nonlocal badges
+        for _ in executor.map(generate_badge, badge_jobs(added, args.server_url), chunksize=64):
+            badges += 1
+
+    try:
+        with open(args.csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+            summary = import_attendees(f, store, EMAIL_PATTERN, args.chunk_size,
+                                       make_badges if executor else None)
+    finally:
+        if executor:
+            executor.shutdown()
+
+    print(f"✅ Imported {summary['imported']} of {summary['rows']} rows "
+          f"in {time.perf_counter() - started:.1f}s")
+    print(f"   Duplicates skipped: {summary['duplicates']}")
+    print(f"   Invalid emails: {summary['invalid']}")
+    if args.badges:
+        print(f"   Badges generated: {badges}")
+
+
+if __name__ == '__main__':
+    main()
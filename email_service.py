@@ -2,7 +2,6 @@
 Email service using Brevo API (formerly Sendinblue)
 Free: 300 emails/day, works on Render, NO domain verification needed!
 """
-import requests
 import os
 
 # Get API key from environment
@@ -30,6 +29,9 @@ def send_email_http(to_email, subject, html_body, from_email=None):
         return False
     
     try:
+        # Imported lazily so it stays off the app's startup path
+        import requests
+        
         print(f"📧 Sending email to {to_email} via Brevo API...")
         
         response = requests.post(
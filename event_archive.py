@@ -0,0 +1,229 @@
+"""
+Columnar archive of past roadshow events
+Converts a finished event (the same data /admin-download-csv exports) into
+one partition per event date of typed NumPy columns, and answers season-wide
+questions by memory-mapping those columns instead of re-parsing CSVs.
+
+Usage:
+    python event_archive.py archive [--date YYYY-MM-DD]
+    python event_archive.py dwell
+    python event_archive.py attendance
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+from datetime import datetime
+from zipfile import ZipFile, ZIP_DEFLATED
+
+ARCHIVE_DIR = os.environ.get('ARCHIVE_DIR', 'archive')
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+EVENT_DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+# Column name -> dtype. Emails and projects are dictionary-encoded, times are
+# unix seconds, dwell is minutes - small enough for thousands of visits per event.
+VISIT_COLUMNS = {
+    'visitor': 'int32',
+    'project': 'int8',
+    'entry': 'int64',
+    'exit': 'int64',
+    'minutes': 'float32',
+}
+REGISTRATION_COLUMNS = {
+    'visitor': 'int32',
+    'entry': 'int64',
+    'exit': 'int64',
+}
+
+
+def _numpy():
+    """numpy is optional and imported on first use, keeping it off the app's startup path"""
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError('numpy is required for the event archive (pip install numpy)')
+    return numpy
+
+
+def validate_event_date(event_date):
+    """Partition names come from request args - only accept a real YYYY-MM-DD date"""
+    try:
+        if not EVENT_DATE_PATTERN.match(event_date):
+            raise ValueError()
+        datetime.strptime(event_date, '%Y-%m-%d')
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid event date {event_date!r} (expected YYYY-MM-DD)')
+    return event_date
+
+
+def _timestamp(value):
+    """Unix seconds for a CSV timestamp, 0 when missing"""
+    if not value:
+        return 0
+    return int(datetime.strptime(value, TIMESTAMP_FORMAT).timestamp())
+
+
+class EventArchive:
+    """Archive root holding one partition directory per event date"""
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+
+    def partitions(self):
+        """Archived event dates, oldest first"""
+        if not os.path.exists(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if EVENT_DATE_PATTERN.match(name) and os.path.exists(os.path.join(self.root, name, 'meta.json')))
+
+    def archive(self, store, projects, event_date=None):
+        """Convert the store's current export into a columnar partition; returns its meta dict"""
+        if event_date is not None:
+            validate_event_date(event_date)
+
+        # Reuse the admin export so every store backend archives the same way
+        export = io.BytesIO()
+        with ZipFile(export, 'w', ZIP_DEFLATED) as zf:
+            store.export(zf)
+
+        emails = {}        # lowercased email -> visitor code
+        email_list = []
+        registrations = {name: [] for name in REGISTRATION_COLUMNS}
+        visits = {name: [] for name in VISIT_COLUMNS}
+        project_codes = {project['name']: int(project_id) for project_id, project in projects.items()}
+
+        def visitor_code(email):
+            key = email.lower()
+            if key not in emails:
+                emails[key] = len(email_list)
+                email_list.append(email)
+            return emails[key]
+
+        with ZipFile(export) as zf:
+            names = zf.namelist()
+            if 'master_entry_exit_times.csv' in names:
+                with zf.open('master_entry_exit_times.csv') as f:
+                    for row in csv.DictReader(io.TextIOWrapper(f, encoding='utf-8', newline='')):
+                        registrations['visitor'].append(visitor_code(row['Email']))
+                        registrations['entry'].append(_timestamp(row['Entry Timestamp']))
+                        registrations['exit'].append(_timestamp(row['Exit Timestamp']))
+
+            for name in names:
+                if not name.startswith('modules/'):
+                    continue
+                with zf.open(name) as f:
+                    for row in csv.DictReader(io.TextIOWrapper(f, encoding='utf-8', newline='')):
+                        code = visitor_code(row['Email'])
+                        for project_name, project_code in project_codes.items():
+                            entry = _timestamp(row.get(f'{project_name} Entry Time'))
+                            exit_ = _timestamp(row.get(f'{project_name} Exit Time'))
+                            if not entry or not exit_:
+                                continue
+                            visits['visitor'].append(code)
+                            visits['project'].append(project_code)
+                            visits['entry'].append(entry)
+                            visits['exit'].append(exit_)
+                            visits['minutes'].append((exit_ - entry) / 60)
+
+        if event_date is None:
+            entries = [ts for ts in registrations['entry'] if ts]
+            event_date = datetime.fromtimestamp(min(entries) if entries else datetime.now().timestamp()).strftime('%Y-%m-%d')
+
+        partition = os.path.join(self.root, validate_event_date(event_date))
+        os.makedirs(partition, exist_ok=True)
+        self._write_table(partition, 'visits', VISIT_COLUMNS, visits)
+        self._write_table(partition, 'registrations', REGISTRATION_COLUMNS, registrations)
+
+        # Keep the raw export (deflate-compressed) alongside for audits
+        with open(os.path.join(partition, 'source.zip'), 'wb') as f:
+            f.write(export.getvalue())
+
+        # Visitor dictionary lives apart from meta.json so queries never have to read it
+        with open(os.path.join(partition, 'visitors.json'), 'w') as f:
+            json.dump(email_list, f)
+
+        meta = {
+            'event_date': event_date,
+            'projects': {str(code): name for name, code in project_codes.items()},
+            'registrations': len(registrations['visitor']),
+            'visits': len(visits['visitor']),
+        }
+        with open(os.path.join(partition, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+        return meta
+
+    @staticmethod
+    def _write_table(partition, table, columns, data):
+        np = _numpy()
+        for name, dtype in columns.items():
+            np.save(os.path.join(partition, f'{table}.{name}.npy'), np.asarray(data[name], dtype=dtype))
+
+    def load(self, event_date, table='visits'):
+        """Memory-mapped columns of one partition - nothing is read until it is used"""
+        np = _numpy()
+        columns = VISIT_COLUMNS if table == 'visits' else REGISTRATION_COLUMNS
+        partition = os.path.join(self.root, validate_event_date(event_date))
+        return {name: np.load(os.path.join(partition, f'{table}.{name}.npy'), mmap_mode='r')
+                for name in columns}
+
+    def meta(self, event_date):
+        with open(os.path.join(self.root, validate_event_date(event_date), 'meta.json')) as f:
+            return json.load(f)
+
+    def average_dwell_per_project(self, dates=None):
+        """Average minutes per visit for each project across the given (default: all) events"""
+        np = _numpy()
+        totals = {}
+        for event_date in dates or self.partitions():
+            visits = self.load(event_date)
+            if not len(visits['project']):
+                continue
+            projects = self.meta(event_date)['projects']
+            sums = np.bincount(visits['project'], weights=visits['minutes'])
+            counts = np.bincount(visits['project'])
+            for code in np.nonzero(counts)[0]:
+                name = projects.get(str(code), f'Module {code}')
+                total, count = totals.get(name, (0.0, 0))
+                totals[name] = (total + float(sums[code]), count + int(counts[code]))
+        return {name: round(total / count, 2) for name, (total, count) in totals.items()}
+
+    def attendance(self, dates=None):
+        """Checked-in visitors and completed visits per event"""
+        np = _numpy()
+        summary = {}
+        for event_date in dates or self.partitions():
+            registrations = self.load(event_date, 'registrations')
+            summary[event_date] = {
+                'checked_in': int(np.count_nonzero(registrations['entry'])),
+                'visits': int(len(self.load(event_date)['project'])),
+            }
+        return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Archive finished events and query the season')
+    sub = parser.add_subparsers(dest='command', required=True)
+    archive_cmd = sub.add_parser('archive', help='archive the current event data')
+    archive_cmd.add_argument('--date', help='event date (default: date of the first entry)')
+    sub.add_parser('dwell', help='average dwell per project across all archived events')
+    sub.add_parser('attendance', help='check-ins and visits per archived event')
+    args = parser.parse_args()
+
+    archive = EventArchive()
+    if args.command == 'archive':
+        from app import store, PROJECTS
+        meta = archive.archive(store, PROJECTS, args.date)
+        print(f"✅ Archived {meta['event_date']}: {meta['registrations']} registrations, {meta['visits']} visits")
+    elif args.command == 'dwell':
+        for name, minutes in sorted(archive.average_dwell_per_project().items()):
+            print(f"   {name}: {minutes} min")
+    else:
+        for event_date, counts in archive.attendance().items():
+            print(f"   {event_date}: {counts['checked_in']} checked in, {counts['visits']} visits")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Fragment cache for the projects and project detail pages
+Renders the static parts of a template once per catalog version and only
+splices in the small per-visitor slots on each request.
+"""
+import hashlib
+import json
+import threading
+
+from flask import render_template
+from markupsafe import Markup
+
+# Slots are rendered as these markers, then cut out of the cached output
+SLOT_MARKER = '\x00slot:{}\x00'
+
+
+def catalog_version(projects):
+    """Short hash of the project catalog - cached pages are rebuilt when it changes"""
+    payload = json.dumps(projects, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(payload).hexdigest()[:12]
+
+
+class FragmentCache:
+    """
+    Caches a template as a list of static chunks and slot names.
+
+    Slot values must already be encoded for where they appear in the page
+    (escape() for HTML text, JSON for script literals) since they bypass
+    Jinja's autoescaping.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._fragments = {}
+        self._lock = threading.Lock()
+
+    def render(self, template_name, key, context, slots):
+        """Render `template_name` with static `context`, filling in per-visitor `slots`"""
+        cache_key = (template_name, key)
+        fragments = self._fragments.get(cache_key)
+        # In debug mode templates auto-reload, so always rebuild
+        if fragments is None or self.app.jinja_env.auto_reload:
+            fragments = self._build(template_name, context, slots)
+            with self._lock:
+                self._fragments[cache_key] = fragments
+        chunks, slot_names = fragments
+
+        parts = [chunks[0]]
+        for name, chunk in zip(slot_names, chunks[1:]):
+            parts.append(slots[name])
+            parts.append(chunk)
+        return ''.join(parts)
+
+    def _build(self, template_name, context, slots):
+        markers = {name: Markup(SLOT_MARKER.format(name)) for name in slots}
+        html = render_template(template_name, **context, **markers)
+
+        # Split on the markers: even items are static chunks, odd items slot names
+        pieces = html.split('\x00')
+        chunks = pieces[0::2]
+        slot_names = [piece[len('slot:'):] for piece in pieces[1::2]]
+        return chunks, slot_names
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+
+    def __len__(self):
+        return len(self._fragments)
@@ -15,7 +15,7 @@ os.makedirs(QR_DIR, exist_ok=True)
 # You'll need to replace this with your actual server IP address
 SERVER_URL = "https://eba-comcast-roadshow.onrender.com"  # Your public Render URL
 
-def generate_qr_code(data, filename, label):
+def generate_qr_code(data, filename, label, quiet=False):
     """Generate a QR code with a label"""
     
     # Create QR code
@@ -70,7 +70,8 @@ def generate_qr_code(data, filename, label):
     # Save image
     filepath = os.path.join(QR_DIR, filename)
     labeled_img.save(filepath)
-    print(f"✅ Generated: {filepath}")
+    if not quiet:
+        print(f"✅ Generated: {filepath}")
     return filepath
 
 def main():
@@ -0,0 +1,14 @@
+"""
+Gunicorn settings for Render
+Threaded workers by default so slow I/O (email, exports) only holds one
+thread; set GUNICORN_WORKER_CLASS=sync for the old one-request-per-process mode.
+"""
+import os
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('WEB_CONCURRENCY', '2'))
+threads = int(os.environ.get('GUNICORN_THREADS', '16')) if worker_class == 'gthread' else 1
+
+# Build the app once in the master so forked workers share warm state (see create_app)
+preload_app = True
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
@@ -0,0 +1,163 @@
+"""
+Event-wide leaderboards
+Completed visits are read from the shared event journal (recovery_journal.py);
+each worker tails it into bounded top-K indexes, so reads are O(K) and never
+touch the time_tracking/ directory. With STATE_BACKEND=redis the journal only
+covers one instance, so RedisStore keeps the same leaderboards in sorted sets.
+"""
+import os
+import threading
+import time
+
+from recovery_journal import skip_malformed
+from write_buffer import tail_rows
+
+LEADERBOARD_SIZE = int(os.environ.get('LEADERBOARD_SIZE', '10'))
+LEADERBOARD_TTL = float(os.environ.get('LEADERBOARD_TTL', '2'))
+
+
+class TopK:
+    """Scores for every key plus a bounded, sorted list of the K best"""
+
+    def __init__(self, k):
+        self.k = k
+        self.scores = {}
+        self.top = []  # [(score, key)] sorted best first
+
+    def update(self, key, score):
+        previous = self.scores.get(key)
+        self.scores[key] = score
+        in_top = previous is not None and (previous, key) in self.top
+
+        if in_top:
+            self.top.remove((previous, key))
+            if score < previous and len(self.scores) > self.k:
+                # Someone outside the top K may now outrank this key - rare, so rebuild
+                self._rebuild()
+                return
+        elif len(self.top) >= self.k and (score, key) <= self.top[-1]:
+            return
+
+        self.top.append((score, key))
+        self.top.sort(reverse=True)
+        del self.top[self.k:]
+
+    def _rebuild(self):
+        ranked = sorted(((score, key) for key, score in self.scores.items()), reverse=True)
+        self.top = ranked[:self.k]
+
+    def items(self):
+        return [(key, score) for score, key in self.top]
+
+
+class Leaderboard:
+    """Booths completed, total dwell and per-project dwell, built from the journal's 'end' events"""
+
+    def __init__(self, log_path, projects, k=LEADERBOARD_SIZE, ttl=LEADERBOARD_TTL):
+        self.log_path = log_path
+        self.projects = projects
+        self.k = k
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._offset = 0
+        self._visits = {}  # email -> {project_id: minutes}
+        self.booths = TopK(self.k)
+        self.dwell = TopK(self.k)
+        self.per_project = {project_id: TopK(self.k) for project_id in self.projects}
+        self._snapshot = None
+        self._refreshed_at = 0.0
+
+    def prime(self, visits, offset):
+        """
+        Start from visits already folded by the journal ({email: {project_id: minutes}})
+        at journal `offset`, instead of replaying the whole journal on the first refresh
+        """
+        with self._lock:
+            self._reset()
+            for email, projects in visits.items():
+                known = {project_id: minutes for project_id, minutes in projects.items()
+                         if project_id in self.per_project}
+                if not known:
+                    continue
+                self._visits[email] = known
+                self.booths.scores[email] = len(known)
+                self.dwell.scores[email] = round(sum(known.values()), 2)
+                for project_id, minutes in known.items():
+                    self.per_project[project_id].scores[email] = minutes
+            for board in (self.booths, self.dwell, *self.per_project.values()):
+                board._rebuild()
+            self._offset = offset
+
+    def apply(self, email, project_id, minutes):
+        """Fold one visit into the indexes - a later visit to the same project replaces the earlier one"""
+        if project_id not in self.per_project:
+            return
+        # Registration is case-insensitive, and so is the journal's recovered state
+        email = email.lower()
+        visits = self._visits.setdefault(email, {})
+        visits[project_id] = minutes
+        self.booths.update(email, len(visits))
+        self.dwell.update(email, round(sum(visits.values()), 2))
+        self.per_project[project_id].update(email, minutes)
+
+    def refresh(self):
+        """Apply journal rows written (by any worker) since the last refresh"""
+        rows, offset = tail_rows(self.log_path, self._offset)
+        if rows is None:
+            # Journal was truncated (new event) - start over
+            self._reset()
+            rows, offset = tail_rows(self.log_path, 0)
+        self._offset = offset
+        for kind, email, project_id, minutes in skip_malformed(rows, 'leaderboard'):
+            if kind == 'end':
+                self.apply(email, project_id, float(minutes))
+        if rows:
+            self._snapshot = None
+
+    def snapshot(self):
+        """Current leaderboards, refreshed from the journal at most once per TTL"""
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is None or now - self._refreshed_at >= self.ttl:
+                self.refresh()
+                self._refreshed_at = now
+                if self._snapshot is None:
+                    self._snapshot = self._build_snapshot()
+            return self._snapshot
+
+    def _build_snapshot(self):
+        return build_snapshot(
+            self.projects, self.booths.items(), self.dwell.items(),
+            {project_id: board.items() for project_id, board in self.per_project.items()})
+
+
+def build_snapshot(projects, booths, dwell, per_project):
+    """/leaderboard payload from ranked [(email, score)] lists, best first"""
+    return {
+        'booths_completed': [
+            {'visitor': display_name(email), 'booths': count}
+            for email, count in booths
+        ],
+        'total_dwell': [
+            {'visitor': display_name(email), 'duration': minutes}
+            for email, minutes in dwell
+        ],
+        'projects': {
+            project_id: {
+                'project_name': projects[project_id]['name'],
+                'top': [
+                    {'visitor': display_name(email), 'duration': minutes}
+                    for email, minutes in per_project.get(project_id, [])
+                ]
+            }
+            for project_id in projects
+        }
+    }
+
+
+def display_name(email):
+    """Public leaderboards show only the part before the @"""
+    return email.split('@', 1)[0]
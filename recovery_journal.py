@@ -0,0 +1,293 @@
+"""
+Write-ahead journal of registration and visit events
+Every check-in, visit start/end and exit is appended to a shared journal
+before the request returns. Each worker tails it into live state (registered
+emails, open visits, per-project totals), and every JOURNAL_SNAPSHOT_BYTES of
+journal that state is written out as a compact snapshot recording the journal
+offset it covers. On startup only the snapshot and the journal tail after it
+are read, so recovery time stays flat however far into the event we are.
+The leaderboards (leaderboard.py) are fed from the same journal.
+
+The journal is a local file: with STATE_BACKEND=redis it only covers this
+instance - open visits and counters shared by all instances live in Redis.
+
+Usage:
+    python recovery_journal.py            # recover and report timing
+    python recovery_journal.py snapshot   # force a snapshot now
+"""
+
+import csv
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from datetime import datetime
+
+from write_buffer import writer as csv_writer, atomic_write, file_lock, tail_rows
+
+JOURNAL_FILE = os.environ.get('JOURNAL_FILE', 'journal.csv')
+JOURNAL_SNAPSHOT_FILE = os.environ.get('JOURNAL_SNAPSHOT_FILE', 'journal_snapshot.json')
+JOURNAL_SNAPSHOT_BYTES = int(os.environ.get('JOURNAL_SNAPSHOT_BYTES', str(64 * 1024)))  # ~1500 events
+
+JOURNAL_KINDS = {'journal', 'register', 'start', 'end', 'exit'}
+
+
+def well_formed(row):
+    """True for a complete journal row: four fields, a known kind and (for 'end') numeric minutes"""
+    if len(row) != 4 or row[0] not in JOURNAL_KINDS:
+        return False
+    if row[0] == 'end':
+        try:
+            float(row[3])
+        except ValueError:
+            return False
+    return True
+
+
+def skip_malformed(rows, source):
+    """Well-formed rows only - anything else (e.g. torn by a crash mid-append) is logged and dropped"""
+    good = []
+    for row in rows:
+        if well_formed(row):
+            good.append(row)
+        else:
+            print(f"⚠️ Skipping malformed {source} row: {row!r}")
+    return good
+
+
+class RecoveryJournal:
+    """Journal + snapshot pair; all mutations go through record() and are applied by tailing"""
+
+    def __init__(self, path=JOURNAL_FILE, snapshot_path=JOURNAL_SNAPSHOT_FILE,
+                 snapshot_bytes=JOURNAL_SNAPSHOT_BYTES):
+        self.path = path
+        self.snapshot_path = snapshot_path
+        self.snapshot_bytes = snapshot_bytes
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._offset = 0
+        self.journal_id = None
+        self.events = 0
+        self.registered = set()   # lowercased emails
+        self.open_visits = {}     # lowercased email -> {project_id: start ISO timestamp}
+        self.visits = {}          # lowercased email -> {project_id: minutes of their latest visit}
+        self.projects = {}        # project_id -> {'visits': n, 'minutes': total} over self.visits
+
+    def ensure_header(self):
+        """Start a new journal with a header row carrying a random id (snapshots are tied to it)"""
+        def write_header(path):
+            if not os.path.exists(path) or os.path.getsize(path) == 0:
+                with open(path, 'w', newline='') as f:
+                    csv.writer(f).writerow(['journal', secrets.token_hex(8), '', datetime.now().isoformat()])
+
+        csv_writer.update(self.path, write_header)
+
+    def _read_journal_id(self):
+        """Id from the journal's header row, None for a missing or headerless journal"""
+        try:
+            with open(self.path, 'r', newline='') as f:
+                header = next(csv.reader(f), None)
+        except OSError:
+            return None
+        return header[1] if header and header[0] == 'journal' else None
+
+    def record(self, kind, email, project_id='', value='', wait=True):
+        """
+        Append one event (durable once this returns).
+        With wait=False returns a function that waits for the commit, so the caller can
+        put another write (e.g. the visitor's CSV) in the same group commit meanwhile.
+        """
+        future = csv_writer.append_rows(self.path, [[kind, email, project_id, value]], wait=False)
+        if not wait:
+            return lambda: self._committed(future)
+        self._committed(future)
+
+    def _committed(self, future):
+        start, end = future.result()
+        # Appends are serialized across workers, so exactly one crosses each boundary - that one snapshots
+        if start // self.snapshot_bytes != end // self.snapshot_bytes:
+            self.snapshot()
+
+    def register(self, email, entry_time):
+        self.record('register', email, '', entry_time)
+
+    def start_visit(self, email, project_id, start_time):
+        self.record('start', email, project_id, start_time)
+
+    def end_visit(self, email, project_id, minutes, wait=True):
+        return self.record('end', email, project_id, minutes, wait)
+
+    def exit(self, email, exit_time):
+        self.record('exit', email, '', exit_time)
+
+    def apply(self, kind, email, project_id, value):
+        if kind == 'journal':
+            self.journal_id = email
+            return
+        key = email.lower()
+        if kind == 'register':
+            self.registered.add(key)
+        elif kind == 'start':
+            self.open_visits.setdefault(key, {})[project_id] = value
+        elif kind == 'end':
+            open_visits = self.open_visits.get(key, {})
+            open_visits.pop(project_id, None)
+            if not open_visits:
+                self.open_visits.pop(key, None)
+            # One visit per (visitor, project) - a repeated end replaces the earlier time, like the leaderboards
+            minutes = float(value)
+            visits = self.visits.setdefault(key, {})
+            previous = visits.get(project_id)
+            visits[project_id] = minutes
+            totals = self.projects.setdefault(project_id, {'visits': 0, 'minutes': 0.0})
+            if previous is None:
+                totals['visits'] += 1
+            totals['minutes'] = round(totals['minutes'] + minutes - (previous or 0.0), 2)
+        elif kind == 'exit':
+            self.open_visits.pop(key, None)
+        self.events += 1
+
+    def _catch_up(self, lock=True):
+        """Apply journal rows written (by any worker) since our offset"""
+        rows, offset = tail_rows(self.path, self._offset, lock=lock)
+        if rows is None:
+            # Journal was reset (new event) - start over
+            self._reset()
+            rows, offset = tail_rows(self.path, 0, lock=lock)
+        self._offset = offset
+        for row in skip_malformed(rows, 'journal'):
+            self.apply(*row)
+
+    def _trim_torn_tail(self):
+        """
+        Cut off anything after the last well-formed row from our offset on (a crash mid-append).
+        Caller holds the exclusive journal lock; returns the number of bytes removed.
+        """
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(self._offset)
+            data = f.read()
+        good_end = 0
+        position = 0
+        for line in data.splitlines(keepends=True):
+            position += len(line)
+            row = next(csv.reader([line.decode('utf-8', 'replace')]), [])
+            if line.endswith(b'\n') and well_formed(row):
+                good_end = position
+        if good_end == len(data):
+            return 0
+        with open(self.path, 'r+b') as f:
+            f.truncate(self._offset + good_end)
+            f.flush()
+            os.fsync(f.fileno())
+        return len(data) - good_end
+
+    def snapshot(self):
+        """Write the live state to disk, consistent with the journal at this instant"""
+        # Same lock order as the readers: our lock, then the journal's - exclusive here so
+        # nothing is appended while the state is captured
+        with self._lock, file_lock(self.path):
+            self._catch_up(lock=False)
+            state = {
+                'journal_id': self.journal_id,
+                'offset': self._offset,
+                'events': self.events,
+                'taken_at': datetime.now().isoformat(),
+                'registered': sorted(self.registered),
+                'open_visits': self.open_visits,
+                'visits': self.visits,
+                'projects': self.projects,
+            }
+            with atomic_write(self.snapshot_path, fsync=True) as f:
+                json.dump(state, f, separators=(',', ':'))
+        return state['offset']
+
+    def _load_snapshot(self):
+        """Restore state from the snapshot file; returns False if missing or taken from another journal"""
+        try:
+            with open(self.snapshot_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        journal_id = self._read_journal_id()
+        if journal_id is None or state.get('journal_id') != journal_id:
+            # Journal was reset (or replaced) since this snapshot
+            return False
+        if state['offset'] > os.path.getsize(self.path):
+            return False
+        self.journal_id = journal_id
+        self._offset = state['offset']
+        self.events = state['events']
+        self.registered = set(state['registered'])
+        self.open_visits = state['open_visits']
+        self.visits = state.get('visits', {})
+        self.projects = state['projects']
+        return True
+
+    def recover(self):
+        """Load the latest snapshot and replay the journal tail; returns timing stats"""
+        started = time.perf_counter()
+        self.ensure_header()
+        with self._lock, file_lock(self.path):
+            self._reset()
+            from_snapshot = self._load_snapshot()
+            snapshot_events = self.events
+            trimmed = self._trim_torn_tail()
+            if trimmed:
+                print(f"⚠️ Trimmed {trimmed} bytes of torn journal tail")
+            self._catch_up(lock=False)
+            replayed = self.events - snapshot_events
+        return {
+            'from_snapshot': from_snapshot,
+            'snapshot_events': snapshot_events,
+            'replayed': replayed,
+            'trimmed_bytes': trimmed,
+            'ms': round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def open_visit(self, email, project_id):
+        """Start time of an unfinished visit, e.g. when the visitor's session lost it"""
+        with self._lock:
+            self._catch_up()
+            return self.open_visits.get(email.lower(), {}).get(project_id)
+
+    def completed_visits(self):
+        """({email: {project_id: minutes}}, journal offset they cover) - seeds the leaderboards"""
+        with self._lock:
+            self._catch_up()
+            return {email: dict(projects) for email, projects in self.visits.items()}, self._offset
+
+    def stats(self):
+        with self._lock:
+            self._catch_up()
+            return {
+                'events': self.events,
+                'registered': len(self.registered),
+                'open_visits': sum(len(visits) for visits in self.open_visits.values()),
+                'projects': {project_id: dict(totals) for project_id, totals in self.projects.items()},
+                'journal_bytes': self._offset,
+            }
+
+
+def main():
+    journal = RecoveryJournal()
+    if len(sys.argv) > 1 and sys.argv[1] == 'snapshot':
+        journal.recover()
+        offset = journal.snapshot()
+        print(f"✅ Snapshot written at journal offset {offset} ({journal.events} events)")
+        return
+    result = journal.recover()
+    source = 'snapshot + tail' if result['from_snapshot'] else 'full journal'
+    print(f"🔁 Recovered {result['snapshot_events'] + result['replayed']} events from {source} "
+          f"({result['replayed']} replayed) in {result['ms']} ms")
+    stats = journal.stats()
+    print(f"   {stats['registered']} registered, {stats['open_visits']} open visits")
+
+
+if __name__ == '__main__':
+    main()
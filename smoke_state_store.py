@@ -0,0 +1,107 @@
+"""
+Smoke check for the state store backends
+Runs the same register / pre-registered check-in / visit / export sequence
+against FileStore (in a temp directory) and RedisStore on fakeredis, so the
+Lua scripts are exercised without a redis-server, plus RedisStore's sorted-set
+leaderboards.
+
+Usage: pip install -r requirements-dev.txt && python smoke_state_store.py
+"""
+
+import csv
+import io
+import os
+import shutil
+import sys
+import tempfile
+from zipfile import ZipFile
+
+from state_store import ENTRY_FIELDNAMES, FileStore, RedisStore
+
+PROJECTS = {
+    '1': {'name': 'PMO', 'estimated_time': '15 minutes'},
+    '2': {'name': 'Data & Governance', 'estimated_time': '15 minutes'},
+}
+
+
+def check(store):
+    # Walk-in registration, then a duplicate (case-insensitive)
+    assert store.register('walkin@x.com', '2026-10-19 09:00:00') is True
+    assert store.register('WALKIN@x.com', '2026-10-19 09:01:00') is False
+
+    # Bulk invitees: duplicates within the batch and of existing entries are skipped
+    added = store.preregister_many(['invitee@x.com', 'Invitee@x.com', 'walkin@x.com', 'other@x.com'])
+    assert added == ['invitee@x.com', 'other@x.com'], added
+
+    # Invitee checks in once
+    assert store.register('invitee@x.com', '2026-10-19 09:05:00') is True
+    assert store.register('invitee@x.com', '2026-10-19 09:06:00') is False
+
+    # One completed visit, then exit
+    store.start_visit('walkin@x.com', '1', '2026-10-19T09:10:00')
+    store.end_visit('walkin@x.com', '1', '2026-10-19 09:10:00', '2026-10-19 09:25:00', 15.0)
+    store.mark_exit('walkin@x.com', '2026-10-19 10:00:00')
+
+    counters = store.counters()
+    assert counters['registrations'] == 2, counters
+    assert counters['preregistered'] == 1, counters
+
+    # Export: master lists everyone (other@ still without an entry time) plus one module file
+    buffer = io.BytesIO()
+    with ZipFile(buffer, 'w') as zf:
+        store.export(zf)
+    with ZipFile(buffer) as zf:
+        names = zf.namelist()
+        master = list(csv.DictReader(io.StringIO(zf.read('master_entry_exit_times.csv').decode())))
+        module = list(csv.DictReader(io.StringIO(zf.read('modules/walkin_at_x_com_time_tracking.csv').decode())))
+    rows = {row['Email'].lower(): row for row in master}
+    assert list(master[0]) == ENTRY_FIELDNAMES
+    assert set(rows) == {'walkin@x.com', 'invitee@x.com', 'other@x.com'}, rows
+    assert rows['walkin@x.com']['Exit Timestamp'] == '2026-10-19 10:00:00'
+    assert rows['invitee@x.com']['Entry Timestamp'] == '2026-10-19 09:05:00'
+    assert rows['other@x.com']['Entry Timestamp'] == ''
+    assert names.count('modules/walkin_at_x_com_time_tracking.csv') == 1, names
+    assert module[0]['PMO Exit Time'] == '2026-10-19 09:25:00'
+
+
+def check_leaderboard(store):
+    # Repeated end for the same booth replaces its time; booths and dwell follow
+    store.end_visit('Lead@x.com', '1', '2026-10-19 09:00:00', '2026-10-19 09:10:00', 10.0)
+    store.end_visit('lead@x.com', '1', '2026-10-19 09:00:00', '2026-10-19 09:12:00', 12.5)
+    store.end_visit('lead@x.com', '2', '2026-10-19 09:20:00', '2026-10-19 09:23:00', 3.0)
+    board = store.leaderboard()
+    assert board['booths_completed'][0] == {'visitor': 'lead', 'booths': 2}, board
+    assert board['total_dwell'][0] == {'visitor': 'lead', 'duration': 15.5}, board
+    assert board['projects']['1']['top'] == [{'visitor': 'walkin', 'duration': 15.0},
+                                             {'visitor': 'lead', 'duration': 12.5}], board
+    assert board['projects']['2']['project_name'] == 'Data & Governance'
+
+
+def main():
+    print("🚀 State store smoke check")
+    print("=" * 50)
+
+    data_dir = tempfile.mkdtemp(prefix='roadshow-smoke-')
+    try:
+        entry_file = os.path.join(data_dir, 'entry_data.csv')
+        tracking_dir = os.path.join(data_dir, 'time_tracking')
+        os.makedirs(tracking_dir)
+        with open(entry_file, 'w', newline='') as f:
+            csv.writer(f).writerow(ENTRY_FIELDNAMES)
+        check(FileStore(entry_file, tracking_dir, PROJECTS))
+        print("✅ file")
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    try:
+        import fakeredis
+    except ImportError:
+        sys.exit('fakeredis is required (pip install -r requirements-dev.txt)')
+    redis_store = RedisStore(fakeredis.FakeRedis(), PROJECTS)
+    check(redis_store)
+    check_leaderboard(redis_store)
+    print("✅ redis (fakeredis)")
+
+
+if __name__ == '__main__':
+    main()
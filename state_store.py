@@ -0,0 +1,394 @@
+"""
+Shared event state: registrations, active visits, per-visitor times and counters
+FileStore keeps the original CSV layout on local disk (single instance).
+RedisStore keeps the same data in Redis so several instances can share it.
+Select with STATE_BACKEND=file|redis|fakeredis (REDIS_URL for redis).
+"""
+import csv
+import io
+import os
+
+from leaderboard import LEADERBOARD_SIZE, build_snapshot
+from write_buffer import writer as csv_writer, atomic_write, file_lock
+
+STATE_BACKEND = os.environ.get('STATE_BACKEND', 'file')
+REDIS_URL = os.environ.get('REDIS_URL', 'redis://localhost:6379/0')
+REDIS_PREFIX = os.environ.get('REDIS_PREFIX', 'roadshow:')
+
+ENTRY_FIELDNAMES = ['Email', 'Entry Timestamp', 'Exit Timestamp']
+
+
+def sanitize_email_for_filename(email):
+    """Convert email to safe filename (replace @ and . with _)"""
+    return email.replace('@', '_at_').replace('.', '_')
+
+
+def time_tracking_fieldnames(projects):
+    """Columns of a per-visitor time tracking CSV"""
+    fieldnames = ['Email']
+    for project in projects.values():
+        fieldnames += [f"{project['name']} Entry Time", f"{project['name']} Exit Time"]
+    return fieldnames
+
+
+class FileStore:
+    """
+    CSV files on local disk - entry_data.csv plus one file per visitor in time_tracking/.
+    Bulk-imported invitees live in a sidecar CSV until they check in, so a check-in is
+    always a plain append to entry_data.csv.
+    """
+
+    def __init__(self, entry_file, tracking_dir, projects, invitee_file=None):
+        self.entry_file = entry_file
+        self.tracking_dir = tracking_dir
+        self.projects = projects
+        self.invitee_file = invitee_file or os.path.splitext(entry_file)[0] + '_invitees.csv'
+        # Emails in entry_data.csv, valid while the file still matches _entered_stat
+        self._entered = set()
+        self._entered_stat = None
+
+    @staticmethod
+    def _stat(path):
+        st = os.stat(path)
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _entered_emails(self, path):
+        """Lowercased emails in entry_data.csv - rescanned only if someone else wrote it since we last did"""
+        if not os.path.exists(path):
+            return set()
+        if self._stat(path) != self._entered_stat:
+            with open(path, 'r', newline='') as f:
+                self._entered = {row['Email'].lower() for row in csv.DictReader(f)}
+            self._entered_stat = self._stat(path)
+        return self._entered
+
+    def register(self, email, entry_timestamp):
+        """Record a visitor's entry (invitee or walk-in) - returns False if the email has already entered"""
+        def check_and_insert(path):
+            # Check for duplicate email
+            entered = self._entered_emails(path)
+            if email.lower() in entered:
+                return False
+
+            # Log entry data to CSV (exit time will be updated on logout)
+            with open(path, 'a', newline='') as f:
+                csv.writer(f).writerow([email, entry_timestamp, ''])
+            entered.add(email.lower())
+            self._entered_stat = self._stat(path)
+            return True
+
+        # Scan and insert under one exclusive lock so concurrent check-ins can't both pass
+        return csv_writer.update(self.entry_file, check_and_insert)
+
+    def _invitees(self):
+        """Lowercased email -> email for everyone in the invitee sidecar"""
+        invitees = {}
+        if os.path.exists(self.invitee_file):
+            with open(self.invitee_file, 'r', newline='') as f:
+                for row in csv.reader(f):
+                    if row:
+                        invitees[row[0].lower()] = row[0]
+        return invitees
+
+    def preregister_many(self, emails):
+        """Bulk-add invitees, skipping anyone already invited or entered - returns the emails added"""
+        def append_new(path):
+            existing = set(self._invitees())
+            if os.path.exists(self.entry_file):
+                with file_lock(self.entry_file, shared=True), open(self.entry_file, 'r', newline='') as f:
+                    existing.update(row['Email'].lower() for row in csv.DictReader(f))
+            added = []
+            for email in emails:
+                if email.lower() not in existing:
+                    existing.add(email.lower())
+                    added.append(email)
+            with open(path, 'a', newline='') as f:
+                csv.writer(f).writerows([email] for email in added)
+            return added
+
+        # Dedup and append under one lock so concurrent imports can't interleave
+        return csv_writer.update(self.invitee_file, append_new)
+
+    def mark_exit(self, email, exit_timestamp):
+        """Update exit timestamp for employee in entry_data.csv"""
+        self._update_row(email, 'Exit Timestamp', exit_timestamp)
+
+    def _update_row(self, email, column, value):
+        """Set `column` on the email's row in entry_data.csv"""
+        if not os.path.exists(self.entry_file):
+            return
+
+        def rewrite(path):
+            # Rewriting keeps the same set of emails, so a current index stays current
+            index_current = self._stat(path) == self._entered_stat
+
+            # Read all rows
+            rows = []
+            with open(path, 'r', newline='') as f:
+                reader = csv.DictReader(f)
+                fieldnames = reader.fieldnames
+                for row in reader:
+                    if row['Email'].lower() == email.lower():
+                        row[column] = value
+                    rows.append(row)
+
+            # Write back all rows
+            with atomic_write(path) as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(rows)
+            if index_current:
+                self._entered_stat = self._stat(path)
+
+        # Runs under the cross-process file lock in the next group commit
+        csv_writer.update(self.entry_file, rewrite)
+
+    def start_visit(self, email, project_id, start_time):
+        """Open visits live in the visitor's session for the file backend"""
+
+    def end_visit(self, email, project_id, entry_time, exit_time, minutes):
+        """Save time tracking data to employee-specific CSV file with timestamps"""
+        safe_filename = sanitize_email_for_filename(email)
+        file_path = os.path.join(self.tracking_dir, f'{safe_filename}_time_tracking.csv')
+
+        print(f"[DEBUG] Saving time tracking for {email}, Project {project_id}")
+        print(f"[DEBUG] Entry: {entry_time}, Exit: {exit_time}")
+        print(f"[DEBUG] File path: {file_path}")
+
+        def rewrite(path):
+            # Read existing data if file exists
+            project_data = {}
+            if os.path.exists(path):
+                with open(path, 'r', newline='') as f:
+                    reader = csv.DictReader(f)
+                    for row in reader:
+                        project_data = row
+                        break
+
+            # Update project timestamps
+            project_name = self.projects[project_id]['name']
+            project_data['Email'] = email
+            project_data[f'{project_name} Entry Time'] = entry_time
+            project_data[f'{project_name} Exit Time'] = exit_time
+
+            # Write updated data
+            with atomic_write(path) as f:
+                writer = csv.DictWriter(f, fieldnames=time_tracking_fieldnames(self.projects))
+                writer.writeheader()
+                writer.writerow(project_data)
+
+        # Runs under the cross-process file lock in the next group commit
+        csv_writer.update(file_path, rewrite)
+
+        print(f"[DEBUG] Successfully saved to {file_path}")
+
+    def counters(self):
+        registrations = 0
+        entered = set()
+        if os.path.exists(self.entry_file):
+            with file_lock(self.entry_file, shared=True), open(self.entry_file, 'r', newline='') as f:
+                for row in csv.DictReader(f):
+                    registrations += 1
+                    entered.add(row['Email'].lower())
+        preregistered = sum(1 for key in self._invitees() if key not in entered)
+        visitors_tracked = 0
+        if os.path.exists(self.tracking_dir):
+            visitors_tracked = sum(1 for name in os.listdir(self.tracking_dir) if name.endswith('_time_tracking.csv'))
+        return {'registrations': registrations, 'preregistered': preregistered, 'visitors_tracked': visitors_tracked}
+
+    def export(self, zf):
+        """Write the master CSV and every visitor's time tracking CSV into ZipFile `zf`"""
+        # Add entry_data.csv (master file with entry/exit times), then invitees who haven't entered yet
+        if os.path.exists(self.entry_file):
+            with file_lock(self.entry_file, shared=True), open(self.entry_file, 'r', newline='') as f:
+                master = f.read()
+            entered = {row['Email'].lower() for row in csv.DictReader(io.StringIO(master))}
+            pending = io.StringIO()
+            csv.writer(pending).writerows(
+                [email, '', ''] for key, email in self._invitees().items() if key not in entered)
+            zf.writestr('master_entry_exit_times.csv', master + pending.getvalue())
+
+        # Add all employee time tracking files
+        if os.path.exists(self.tracking_dir):
+            for filename in os.listdir(self.tracking_dir):
+                if filename.endswith('_time_tracking.csv'):
+                    file_path = os.path.join(self.tracking_dir, filename)
+                    with file_lock(file_path, shared=True), open(file_path, 'rb') as f:
+                        zf.writestr(f'modules/{filename}', f.read())
+
+
+# KEYS: registrations set, entry hash, entries list, counters hash
+# ARGV: lowercased email, email, entry timestamp
+REGISTER_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    if redis.call('HGET', KEYS[2], 'entry') ~= '' then
+        return 0
+    end
+    redis.call('HSET', KEYS[2], 'entry', ARGV[3])
+    redis.call('HINCRBY', KEYS[4], 'preregistered', -1)
+else
+    redis.call('HSET', KEYS[2], 'email', ARGV[2], 'entry', ARGV[3], 'exit', '')
+    redis.call('RPUSH', KEYS[3], ARGV[1])
+end
+redis.call('HINCRBY', KEYS[4], 'registrations', 1)
+return 1
+"""
+
+# Same keys and args as REGISTER_SCRIPT, for an invitee who hasn't entered yet
+PREREGISTER_SCRIPT = """
+if redis.call('SADD', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[2], 'email', ARGV[2], 'entry', '', 'exit', '')
+redis.call('RPUSH', KEYS[3], ARGV[1])
+redis.call('HINCRBY', KEYS[4], 'preregistered', 1)
+return 1
+"""
+
+# KEYS: active visits hash, times hash, counters hash
+# ARGV: project id, entry time, exit time, minutes
+END_VISIT_SCRIPT = """
+local previous = redis.call('HGET', KEYS[2], ARGV[1] .. ':minutes')
+redis.call('HDEL', KEYS[1], ARGV[1])
+if redis.call('HSETNX', KEYS[2], ARGV[1] .. ':entry', ARGV[2]) == 1 then
+    redis.call('HINCRBY', KEYS[3], 'booths_completed', 1)
+else
+    redis.call('HSET', KEYS[2], ARGV[1] .. ':entry', ARGV[2])
+end
+redis.call('HSET', KEYS[2], ARGV[1] .. ':exit', ARGV[3], ARGV[1] .. ':minutes', ARGV[4])
+redis.call('HINCRBY', KEYS[3], 'visits_completed', 1)
+-- Leaderboards: one visit per (visitor, project) - a repeated end replaces the earlier time
+redis.call('ZADD', KEYS[6], ARGV[4], ARGV[5])
+redis.call('ZINCRBY', KEYS[5], ARGV[4] - (tonumber(previous) or 0), ARGV[5])
+if not previous then
+    redis.call('ZINCRBY', KEYS[4], 1, ARGV[5])
+end
+return 1
+"""
+
+
+class RedisStore:
+    """Registrations, active visits, per-visitor times and counters in Redis, shared by all instances"""
+
+    EXPORT_CHUNK = 500
+
+    def __init__(self, client, projects, prefix=REDIS_PREFIX):
+        self.client = client
+        self.projects = projects
+        self.prefix = prefix
+        self._register = client.register_script(REGISTER_SCRIPT)
+        self._preregister = client.register_script(PREREGISTER_SCRIPT)
+        self._end_visit = client.register_script(END_VISIT_SCRIPT)
+
+    def _key(self, *parts):
+        return self.prefix + ':'.join(parts)
+
+    def _registration_keys(self, key):
+        return [self._key('registrations'), self._key('entry', key),
+                self._key('entries'), self._key('counters')]
+
+    def register(self, email, entry_timestamp):
+        """Duplicate check and insert in one atomic round trip"""
+        key = email.lower()
+        added = self._register(keys=self._registration_keys(key), args=[key, email, entry_timestamp])
+        return bool(added)
+
+    def preregister_many(self, emails):
+        """Bulk-add invitees in one pipelined round trip - returns the emails added"""
+        pipe = self.client.pipeline(transaction=False)
+        for email in emails:
+            key = email.lower()
+            self._preregister(keys=self._registration_keys(key), args=[key, email, ''], client=pipe)
+        return [email for email, added in zip(emails, pipe.execute()) if added]
+
+    def mark_exit(self, email, exit_timestamp):
+        entry_key = self._key('entry', email.lower())
+        if self.client.exists(entry_key):
+            self.client.hset(entry_key, 'exit', exit_timestamp)
+
+    def start_visit(self, email, project_id, start_time):
+        self.client.hset(self._key('active', email.lower()), project_id, start_time)
+
+    def end_visit(self, email, project_id, entry_time, exit_time, minutes):
+        key = email.lower()
+        self._end_visit(
+            keys=[self._key('active', key), self._key('times', key), self._key('counters'),
+                  self._key('leaderboard', 'booths'), self._key('leaderboard', 'dwell'),
+                  self._key('leaderboard', 'project', project_id)],
+            args=[project_id, entry_time, exit_time, minutes, key])
+
+    def leaderboard(self, k=LEADERBOARD_SIZE):
+        """Event-wide leaderboards (same shape as Leaderboard.snapshot()) from the sorted sets, in one round trip"""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zrevrange(self._key('leaderboard', 'booths'), 0, k - 1, withscores=True)
+        pipe.zrevrange(self._key('leaderboard', 'dwell'), 0, k - 1, withscores=True)
+        for project_id in self.projects:
+            pipe.zrevrange(self._key('leaderboard', 'project', project_id), 0, k - 1, withscores=True)
+        booths, dwell, *per_project = [
+            [(self._decode(email), round(score, 2)) for email, score in ranked]
+            for ranked in pipe.execute()
+        ]
+        return build_snapshot(
+            self.projects, [(email, int(count)) for email, count in booths], dwell,
+            dict(zip(self.projects, per_project)))
+
+    def active_visits(self, email):
+        return self._decode_hash(self.client.hgetall(self._key('active', email.lower())))
+
+    def counters(self):
+        return {k: int(v) for k, v in self._decode_hash(self.client.hgetall(self._key('counters'))).items()}
+
+    def export(self, zf):
+        """Build the same ZIP layout as FileStore from Redis, pipelining the reads in chunks"""
+        master = io.StringIO()
+        master_writer = csv.writer(master)
+        master_writer.writerow(ENTRY_FIELDNAMES)
+
+        fieldnames = time_tracking_fieldnames(self.projects)
+        entries = self.client.lrange(self._key('entries'), 0, -1)
+        for start in range(0, len(entries), self.EXPORT_CHUNK):
+            keys = [self._decode(k) for k in entries[start:start + self.EXPORT_CHUNK]]
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(self._key('entry', key))
+                pipe.hgetall(self._key('times', key))
+            results = pipe.execute()
+
+            for entry, times in zip(results[0::2], results[1::2]):
+                entry, times = self._decode_hash(entry), self._decode_hash(times)
+                master_writer.writerow([entry.get('email', ''), entry.get('entry', ''), entry.get('exit', '')])
+                if not times:
+                    continue
+                row = {'Email': entry['email']}
+                for project_id, project in self.projects.items():
+                    if f'{project_id}:entry' in times:
+                        row[f"{project['name']} Entry Time"] = times[f'{project_id}:entry']
+                        row[f"{project['name']} Exit Time"] = times.get(f'{project_id}:exit', '')
+                module = io.StringIO()
+                module_writer = csv.DictWriter(module, fieldnames=fieldnames)
+                module_writer.writeheader()
+                module_writer.writerow(row)
+                filename = f"{sanitize_email_for_filename(entry['email'])}_time_tracking.csv"
+                zf.writestr(f'modules/{filename}', module.getvalue())
+
+        zf.writestr('master_entry_exit_times.csv', master.getvalue())
+
+    @staticmethod
+    def _decode(value):
+        return value.decode('utf-8') if isinstance(value, bytes) else value
+
+    @classmethod
+    def _decode_hash(cls, mapping):
+        return {cls._decode(k): cls._decode(v) for k, v in mapping.items()}
+
+
+def create_store(entry_file, tracking_dir, projects, backend=STATE_BACKEND):
+    """Build the configured store (file by default)"""
+    if backend == 'redis':
+        import redis
+        return RedisStore(redis.Redis.from_url(REDIS_URL), projects)
+    if backend == 'fakeredis':
+        # In-process stand-in for local runs without a redis-server (pip install -r requirements-dev.txt)
+        import fakeredis
+        return RedisStore(fakeredis.FakeRedis(), projects)
+    return FileStore(entry_file, tracking_dir, projects)
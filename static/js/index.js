@@ -0,0 +1,93 @@
+document.getElementById('entryForm').addEventListener('submit', async (e) => {
+    e.preventDefault();
+
+    const submitBtn = document.getElementById('submitBtn');
+    const errorMsg = document.getElementById('errorMessage');
+    const successMsg = document.getElementById('successMessage');
+    const redirectMsg = document.getElementById('redirectMessage');
+
+    // Hide previous messages
+    errorMsg.style.display = 'none';
+    successMsg.style.display = 'none';
+
+    // Disable button
+    submitBtn.disabled = true;
+    submitBtn.textContent = 'Submitting...';
+
+    // Get form data
+    const formData = {
+        email: document.getElementById('email').value.trim()
+    };
+
+    // Validate email domain
+    if (!formData.email.endsWith('@cable.comcast.com')) {
+        errorMsg.textContent = 'Please use your @cable.comcast.com email address';
+        errorMsg.style.display = 'block';
+        submitBtn.disabled = false;
+        submitBtn.textContent = 'Enter Roadshow →';
+        return;
+    }
+
+    try {
+        const response = await fetch('/submit-entry', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(formData)
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            successMsg.textContent = 'Registration successful! Redirecting...';
+            successMsg.style.display = 'block';
+
+            // Redirect to intended project or projects page
+            setTimeout(() => {
+                if (result.redirect_to_project) {
+                    window.location.href = `/project/${result.redirect_to_project}`;
+                } else {
+                    window.location.href = '/projects';
+                }
+            }, 1000);
+        } else if (response.status === 429) {
+            // Server is shedding load - hold the button until Retry-After instead of hammering it
+            const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || result.retry_after || 5;
+            errorMsg.textContent = result.message;
+            errorMsg.style.display = 'block';
+            submitBtn.textContent = `Try again in ${retryAfter}s`;
+            setTimeout(() => {
+                submitBtn.disabled = false;
+                submitBtn.textContent = 'Enter Roadshow →';
+            }, retryAfter * 1000);
+        } else {
+            errorMsg.textContent = result.message || 'Registration failed. Please try again.';
+            errorMsg.style.display = 'block';
+            submitBtn.disabled = false;
+            submitBtn.textContent = 'Enter Roadshow →';
+        }
+    } catch (error) {
+        errorMsg.textContent = 'Network error. Please check your connection and try again.';
+        errorMsg.style.display = 'block';
+        submitBtn.disabled = false;
+        submitBtn.textContent = 'Enter Roadshow →';
+    }
+});
+
+// Check if redirected from team page (URL parameter)
+window.addEventListener('DOMContentLoaded', () => {
+    const urlParams = new URLSearchParams(window.location.search);
+
+    // Pre-fill email from a pre-registration badge QR
+    if (urlParams.get('email')) {
+        document.getElementById('email').value = urlParams.get('email');
+    }
+
+    if (urlParams.get('redirect') === 'register') {
+        const redirectMsg = document.getElementById('redirectMessage');
+        redirectMsg.style.display = 'block';
+        // Auto-focus on first input
+        document.getElementById('email').focus();
+    }
+});
@@ -0,0 +1,317 @@
+let projectStarted = false;
+let startTime = null;
+let timerInterval = null;
+let html5QrCode = null;
+let scannerLoading = null;
+
+// Load the QR scanner library on demand - it is only needed once the attendee taps "Scan QR"
+function loadScanner() {
+    if (window.Html5Qrcode) {
+        return Promise.resolve();
+    }
+    if (!scannerLoading) {
+        scannerLoading = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = scannerUrl;
+            script.async = true;
+            script.onload = () => resolve();
+            script.onerror = () => {
+                scannerLoading = null;  // Allow a retry on the next tap
+                script.remove();
+                reject(new Error('QR scanner failed to load'));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return scannerLoading;
+}
+
+// Auto-open camera if user came from QR scan after registration
+window.addEventListener('DOMContentLoaded', () => {
+    if (showScanPrompt) {
+        const statusMsg = document.getElementById('statusMessage');
+        statusMsg.textContent = '✅ Registered! Now scan the team QR to start timer.';
+        statusMsg.className = 'status-message success';
+        statusMsg.style.display = 'block';
+
+        // Auto-open scanner after a brief delay
+        setTimeout(() => {
+            startQRScanner();
+        }, 1000);
+    }
+});
+
+async function startQRScanner() {
+    const button = document.getElementById('scanButton');
+    const statusMsg = document.getElementById('statusMessage');
+    const qrReader = document.getElementById('qr-reader');
+    const cancelBtn = document.getElementById('cancelScan');
+
+    if (projectStarted) {
+        statusMsg.textContent = 'Project already started! Return to main menu to complete.';
+        statusMsg.className = 'status-message info';
+        statusMsg.style.display = 'block';
+        return;
+    }
+
+    // Hide scan button, show scanner
+    button.style.display = 'none';
+    qrReader.classList.add('active');
+    cancelBtn.classList.add('active');
+    statusMsg.textContent = '📸 Camera starting... Please allow camera access if prompted.';
+    statusMsg.className = 'status-message info';
+    statusMsg.style.display = 'block';
+
+    try {
+        await loadScanner();
+
+        // Scan was cancelled while the library was loading
+        if (!qrReader.classList.contains('active')) {
+            return;
+        }
+
+        html5QrCode = new Html5Qrcode("qr-reader");
+
+        await html5QrCode.start(
+            { facingMode: "environment" }, // Use back camera on mobile
+            {
+                fps: 10,
+                qrbox: { width: 250, height: 250 }
+            },
+            onScanSuccess,
+            onScanFailure
+        );
+
+        statusMsg.textContent = '🎯 Camera ready! Point at the QR code for this team.';
+        statusMsg.className = 'status-message info';
+    } catch (err) {
+        console.error('QR Scanner error:', err);
+        statusMsg.textContent = '❌ Could not start camera: ' + err;
+        statusMsg.className = 'status-message error';
+        stopQRScanner();
+    }
+}
+
+async function onScanSuccess(decodedText, decodedResult) {
+    const statusMsg = document.getElementById('statusMessage');
+
+    console.log('Scanned QR:', decodedText);
+    console.log('Expected project:', expectedProjectId);
+
+    // Extract project ID from scanned QR (handles both simple ID and full URL)
+    let scannedProjectId = decodedText;
+
+    // If it's a full URL, extract the project ID
+    if (decodedText.includes('/project/')) {
+        const match = decodedText.match(/\/project\/(\d+)/);
+        if (match) {
+            scannedProjectId = match[1];
+        }
+    }
+
+    // Check if scanned QR matches this project
+    if (scannedProjectId === expectedProjectId || decodedText === expectedProjectId || decodedText === `project_${expectedProjectId}`) {
+        // Correct QR code scanned!
+        statusMsg.textContent = '✅ Correct QR code! Starting team exploration...';
+        statusMsg.className = 'status-message success';
+        statusMsg.style.display = 'block';
+
+        // Stop scanner
+        await stopQRScanner();
+
+        // Start the project (user is already registered if they reached this page)
+        await startProject();
+    } else {
+        // Wrong QR code
+        statusMsg.textContent = `❌ Wrong QR code! Please scan the QR for ${projectName}.`;
+        statusMsg.className = 'status-message error';
+        statusMsg.style.display = 'block';
+
+        // Play error sound/vibration if available
+        if (navigator.vibrate) {
+            navigator.vibrate(200);
+        }
+    }
+}
+
+function onScanFailure(error) {
+    // Scanning failed, ignore (this happens continuously)
+}
+
+async function stopQRScanner() {
+    const button = document.getElementById('scanButton');
+    const qrReader = document.getElementById('qr-reader');
+    const cancelBtn = document.getElementById('cancelScan');
+
+    if (html5QrCode) {
+        try {
+            await html5QrCode.stop();
+            html5QrCode.clear();
+        } catch (err) {
+            console.error('Error stopping scanner:', err);
+        }
+        html5QrCode = null;
+    }
+
+    qrReader.classList.remove('active');
+    cancelBtn.classList.remove('active');
+    button.style.display = 'flex';
+}
+
+async function startProject() {
+    const button = document.getElementById('scanButton');
+    const statusMsg = document.getElementById('statusMessage');
+    const instruction = document.getElementById('scanInstruction');
+    const timerDisplay = document.getElementById('timerDisplay');
+    const buttonText = document.getElementById('buttonText');
+
+    button.disabled = true;
+    buttonText.textContent = 'Starting...';
+
+    try {
+        const response = await fetch(`/start-project/${expectedProjectId}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            }
+        });
+
+        const result = await response.json();
+
+        if (result.success) {
+            projectStarted = true;
+            startTime = new Date();
+
+            // Update UI
+            instruction.textContent = '✅ Team exploration started! Explore and return to main menu when done.';
+            buttonText.textContent = 'Team Active';
+            statusMsg.textContent = '🎉 Successfully started! Timer is running.';
+            statusMsg.className = 'status-message success';
+            statusMsg.style.display = 'block';
+
+            // Show and start timer
+            timerDisplay.classList.add('active');
+            startTimer();
+        } else {
+            throw new Error(result.message || 'Failed to start project');
+        }
+    } catch (error) {
+        statusMsg.textContent = '❌ ' + error.message;
+        statusMsg.className = 'status-message error';
+        statusMsg.style.display = 'block';
+        button.disabled = false;
+        buttonText.textContent = 'Scan QR Code';
+    }
+}
+
+function startTimer() {
+    timerInterval = setInterval(() => {
+        const now = new Date();
+        const diff = Math.floor((now - startTime) / 1000);
+        const minutes = Math.floor(diff / 60);
+        const seconds = diff % 60;
+
+        document.getElementById('timerValue').textContent = 
+            `${String(minutes).padStart(2, '0')}:${String(seconds).padStart(2, '0')}`;
+    }, 1000);
+}
+
+// End the visit, waiting out Retry-After if the server rate limits us (429) so the time isn't lost
+async function endProject(options = {}, attempts = 3) {
+    for (let attempt = 1; ; attempt++) {
+        const response = await fetch(`/end-project/${expectedProjectId}`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            ...options
+        });
+        if (response.status !== 429 || attempt >= attempts) {
+            return response;
+        }
+        const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || 1;
+        await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+    }
+}
+
+async function goBack() {
+    // Show loading state
+    const backButton = document.querySelector('.back-button');
+    const originalText = backButton.innerHTML;
+    backButton.innerHTML = '<span class="arrow">←</span><span>Returning...</span>';
+    backButton.disabled = true;
+
+    // Stop scanner if running
+    if (html5QrCode) {
+        try {
+            await html5QrCode.stop();
+            html5QrCode.clear();
+        } catch (err) {
+            console.error('Error stopping scanner:', err);
+        }
+        html5QrCode = null;
+    }
+
+    if (projectStarted) {
+        // End project and record time
+        try {
+            const response = await endProject();
+
+            const result = await response.json();
+
+            if (result.success) {
+                if (timerInterval) {
+                    clearInterval(timerInterval);
+                }
+                // Completion is now tracked server-side in session
+            }
+        } catch (error) {
+            console.error('Error ending project:', error);
+        }
+    }
+
+    // Clear timer if running
+    if (timerInterval) {
+        clearInterval(timerInterval);
+    }
+
+    // Always redirect to teams page
+    window.location.href = '/projects';
+}
+
+// Cleanup timer on page unload
+window.addEventListener('beforeunload', () => {
+    if (timerInterval) {
+        clearInterval(timerInterval);
+    }
+});
+
+// Handle browser/phone back button
+window.addEventListener('popstate', async (event) => {
+    if (projectStarted) {
+        // Record the time before leaving
+        try {
+            await endProject();
+        } catch (error) {
+            console.error('Failed to record time:', error);
+        }
+
+        if (timerInterval) {
+            clearInterval(timerInterval);
+        }
+    }
+});
+
+// Handle page visibility change (when user switches tabs or apps on mobile)
+document.addEventListener('visibilitychange', async () => {
+    if (document.hidden && projectStarted) {
+        // User is leaving the page, record time
+        try {
+            await endProject({
+                keepalive: true  // Ensures request completes even if page is closing
+            });
+        } catch (error) {
+            console.error('Failed to record time:', error);
+        }
+    }
+});
@@ -0,0 +1,86 @@
+// Mark completed projects on page load
+document.addEventListener('DOMContentLoaded', () => {
+    // Show completion ticks for completed projects
+    markCompletedProjects();
+
+    // Handle hotspot clicks
+    const hotspots = document.querySelectorAll('.hotspot');
+    hotspots.forEach(hotspot => {
+        hotspot.addEventListener('click', (e) => {
+            const projectId = e.target.getAttribute('data-project');
+
+            // Don't allow clicking on completed projects
+            if (completedProjects.includes(projectId)) {
+                return false;
+            }
+
+            goToProject(projectId);
+        });
+
+        // Visual feedback on hover for non-completed projects only
+        hotspot.addEventListener('mouseenter', (e) => {
+            const projectId = e.target.getAttribute('data-project');
+            if (!completedProjects.includes(projectId)) {
+                e.target.setAttribute('fill', 'rgba(255, 255, 255, 0.2)');
+                e.target.setAttribute('stroke', '#fff');
+                e.target.style.cursor = 'pointer';
+            } else {
+                e.target.style.cursor = 'default';
+            }
+        });
+
+        hotspot.addEventListener('mouseleave', (e) => {
+            const projectId = e.target.getAttribute('data-project');
+            if (!completedProjects.includes(projectId)) {
+                e.target.setAttribute('fill', 'transparent');
+                e.target.setAttribute('stroke', 'transparent');
+            }
+        });
+    });
+});
+
+function markCompletedProjects() {
+    // Show completion tick icons for completed projects
+    completedProjects.forEach(projectId => {
+        const tickIcon = document.querySelector(`.completion-tick[data-project="${projectId}"]`);
+        if (tickIcon) {
+            tickIcon.style.display = 'block';
+            tickIcon.style.animation = 'fadeInScale 0.5s ease-out';
+        }
+
+        // Disable the hotspot for completed projects
+        const hotspot = document.querySelector(`.hotspot[data-project="${projectId}"]`);
+        if (hotspot) {
+            hotspot.style.pointerEvents = 'none';
+            hotspot.style.opacity = '0.5';
+        }
+    });
+}
+
+// Add a subtle animation on load
+document.addEventListener('DOMContentLoaded', () => {
+    const cards = document.querySelectorAll('.project-card');
+    cards.forEach((card, index) => {
+        card.style.animationDelay = `${index * 0.05}s`;
+    });
+
+    // Update leaderboard on load
+    updateLeaderboard();
+    initEventLeaderboard();
+});
+
+// Also update leaderboard when page becomes visible (returning from project)
+document.addEventListener('visibilitychange', () => {
+    if (!document.hidden) {
+        // Reload the page to get updated completion status
+        window.location.reload();
+    }
+});
+
+// Update leaderboard when window gains focus
+window.addEventListener('focus', () => {
+    // Reload the page to get updated completion status
+    setTimeout(() => {
+        window.location.reload();
+    }, 500); // Small delay to ensure any background processes complete
+});
@@ -0,0 +1,78 @@
+// Mark completed projects on page load
+document.addEventListener('DOMContentLoaded', () => {
+    // Show completion ticks for completed projects with enhanced animations
+    markCompletedProjects();
+
+    // Handle hotspot clicks
+    const hotspots = document.querySelectorAll('.hotspot');
+    hotspots.forEach(hotspot => {
+        hotspot.addEventListener('click', (e) => {
+            const projectId = e.target.getAttribute('data-project');
+
+            // Don't allow clicking on completed projects
+            if (completedProjects.includes(projectId)) {
+                return false;
+            }
+
+            goToProject(projectId);
+        });
+
+        // Visual feedback on hover for non-completed projects only
+        hotspot.addEventListener('mouseenter', (e) => {
+            const projectId = e.target.getAttribute('data-project');
+            if (!completedProjects.includes(projectId)) {
+                e.target.setAttribute('fill', 'rgba(255, 255, 255, 0.2)');
+                e.target.setAttribute('stroke', '#fff');
+                e.target.style.cursor = 'pointer';
+            } else {
+                e.target.style.cursor = 'default';
+            }
+        });
+
+        hotspot.addEventListener('mouseleave', (e) => {
+            const projectId = e.target.getAttribute('data-project');
+            if (!completedProjects.includes(projectId)) {
+                e.target.setAttribute('fill', 'transparent');
+                e.target.setAttribute('stroke', 'transparent');
+            }
+        });
+    });
+});
+
+function markCompletedProjects() {
+    // Show animated completion tick icons for completed projects
+    completedProjects.forEach(projectId => {
+        const tickIcon = document.querySelector(`.completion-tick[data-project="${projectId}"]`);
+        if (tickIcon) {
+            tickIcon.style.display = 'block';
+
+            // Trigger the epic entrance animation
+            setTimeout(() => {
+                tickIcon.classList.add('animated-entrance');
+            }, 100);
+        }
+
+        // Disable and fade the hotspot for completed projects
+        const hotspot = document.querySelector(`.hotspot[data-project="${projectId}"]`);
+        if (hotspot) {
+            hotspot.style.pointerEvents = 'none';
+            hotspot.classList.add('completed');
+        }
+    });
+}
+
+// Reload page when returning from project to show updated completion status
+document.addEventListener('visibilitychange', () => {
+    if (!document.hidden) {
+        // Reload the page to get updated completion status
+        window.location.reload();
+    }
+});
+
+// Update when window gains focus
+window.addEventListener('focus', () => {
+    // Reload the page to get updated completion status
+    setTimeout(() => {
+        window.location.reload();
+    }, 500); // Small delay to ensure any background processes complete
+});
@@ -0,0 +1,18 @@
+// Mark completed projects on page load
+document.addEventListener('DOMContentLoaded', () => {
+    completedProjects.forEach(projectId => {
+        markProjectAsCompleted(projectId);
+    });
+});
+
+// Mark a project step as completed
+function markProjectAsCompleted(projectId) {
+    const milestones = document.querySelectorAll('.milestone');
+    milestones.forEach((milestone, index) => {
+        const milestoneNumber = (index + 1).toString();
+        if (milestoneNumber === projectId) {
+            milestone.classList.add('completed');
+            console.log('Marked milestone', projectId, 'as completed');
+        }
+    });
+}
@@ -0,0 +1,130 @@
+// Shared client logic for the roadshow pages (navigation, logout, leaderboards)
+
+function goToProject(projectId) {
+    window.location.href = `/project/${projectId}`;
+}
+
+async function handleLogout() {
+    try {
+        for (let attempt = 1; attempt <= 3; attempt++) {
+            const response = await fetch('/logout', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                }
+            });
+            if (response.status !== 429) {
+                break;
+            }
+            // Rate limited - wait out Retry-After so the exit time is still recorded
+            const retryAfter = parseInt(response.headers.get('Retry-After'), 10) || 1;
+            await new Promise(resolve => setTimeout(resolve, retryAfter * 1000));
+        }
+
+        // Redirect once recorded - CSV files saved on server for admin
+        window.location.href = '/';
+    } catch (error) {
+        // Redirect anyway even on error
+        window.location.href = '/';
+    }
+}
+
+// Update leaderboard with sorted project times
+function updateLeaderboard() {
+    fetch('/get-project-times')
+        .then(response => response.json())
+        .then(data => {
+            const leaderboardContent = document.getElementById('leaderboard-content');
+
+            if (data.times && data.times.length > 0) {
+                // Sort by duration in descending order (longest time first)
+                const sortedTimes = data.times.sort((a, b) => b.duration - a.duration);
+
+                let html = '';
+                sortedTimes.forEach(item => {
+                    html += `
+                        <div class="leaderboard-item">
+                            <div class="leaderboard-item-name">${item.project_name}</div>
+                            <div class="leaderboard-item-time">${item.time_spent}</div>
+                        </div>
+                    `;
+                });
+                leaderboardContent.innerHTML = html;
+            } else {
+                leaderboardContent.innerHTML = '<div class="leaderboard-empty">Visit teams to track your progress here</div>';
+            }
+        })
+        .catch(error => {
+            console.error('Error loading leaderboard:', error);
+        });
+}
+
+// Event-wide leaderboards (everyone at the roadshow) - served from /leaderboard
+const EVENT_LEADERBOARD_REFRESH_MS = 15000;
+let eventLeaderboard = null;
+let eventLeaderboardTab = 'booths_completed';
+
+function renderEventLeaderboard() {
+    const list = document.getElementById('event-leaderboard-list');
+    if (!list || !eventLeaderboard) {
+        return;
+    }
+
+    const entries = eventLeaderboard[eventLeaderboardTab] || [];
+    list.innerHTML = '';
+    if (entries.length === 0) {
+        const empty = document.createElement('li');
+        empty.className = 'leaderboard-empty';
+        empty.textContent = 'No visits yet - be the first!';
+        list.appendChild(empty);
+        return;
+    }
+
+    entries.forEach((entry, index) => {
+        // Visitor names come from user input - textContent only, never innerHTML
+        const item = document.createElement('li');
+        const name = document.createElement('span');
+        name.textContent = `${index + 1}. ${entry.visitor}`;
+        const score = document.createElement('span');
+        score.textContent = eventLeaderboardTab === 'booths_completed'
+            ? `${entry.booths} ${entry.booths === 1 ? 'team' : 'teams'}`
+            : `${entry.duration} min`;
+        item.appendChild(name);
+        item.appendChild(score);
+        list.appendChild(item);
+    });
+}
+
+function updateEventLeaderboard() {
+    fetch('/leaderboard')
+        .then(response => response.json())
+        .then(data => {
+            eventLeaderboard = data;
+            renderEventLeaderboard();
+        })
+        .catch(error => {
+            console.error('Error loading event leaderboard:', error);
+        });
+}
+
+function initEventLeaderboard() {
+    if (!document.getElementById('event-leaderboard-list')) {
+        return;
+    }
+
+    document.querySelectorAll('.leaderboard-tab').forEach(tab => {
+        tab.addEventListener('click', () => {
+            document.querySelectorAll('.leaderboard-tab').forEach(other => other.classList.remove('active'));
+            tab.classList.add('active');
+            eventLeaderboardTab = tab.dataset.board;
+            renderEventLeaderboard();
+        });
+    });
+
+    updateEventLeaderboard();
+    setInterval(() => {
+        if (!document.hidden) {
+            updateEventLeaderboard();
+        }
+    }, EVENT_LEADERBOARD_REFRESH_MS);
+}
@@ -0,0 +1,101 @@
+"""
+Vendor third-party browser libraries into static/vendor
+Run once when bumping a version and commit the result, so event pages never
+depend on a CDN being reachable from the venue Wi-Fi.
+
+Every file is pinned by SHA-256 in static/vendor/SHA256SUMS (sha256sum format,
+committed alongside the files). A download that doesn't match its pin is
+rejected; a file without a pin yet is pinned on first download - review and
+commit both.
+
+Usage:
+    python vendor_assets.py           # download into static/vendor
+    python vendor_assets.py --check   # exit non-zero if anything is missing or doesn't match its pin
+"""
+
+import hashlib
+import os
+import sys
+import urllib.request
+
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'vendor')
+
+SUMS_FILE = os.path.join(VENDOR_DIR, 'SHA256SUMS')
+
+# filename -> pinned source URL (its hash lives in SHA256SUMS)
+VENDORED = {
+    'html5-qrcode.min.js': 'https://unpkg.com/html5-qrcode@2.3.8/html5-qrcode.min.js',
+}
+
+
+def load_sums():
+    """filename -> pinned sha256 hex digest"""
+    sums = {}
+    if os.path.exists(SUMS_FILE):
+        with open(SUMS_FILE) as f:
+            for line in f:
+                if line.strip():
+                    digest, filename = line.split(None, 1)
+                    sums[filename.strip().lstrip('*')] = digest
+    return sums
+
+
+def save_sums(sums):
+    with open(SUMS_FILE, 'w') as f:
+        for filename in sorted(sums):
+            f.write(f"{sums[filename]}  {filename}\n")
+
+
+def vendor(filename, url, sums):
+    """Download `url` into static/vendor/`filename`, verifying (or recording) its pin"""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        data = response.read()
+    digest = hashlib.sha256(data).hexdigest()
+    pinned = sums.get(filename)
+    if pinned and digest != pinned:
+        raise RuntimeError(f"{filename}: sha256 {digest} does not match pinned {pinned} - refusing to vendor")
+
+    path = os.path.join(VENDOR_DIR, filename)
+    with open(path, 'wb') as f:
+        f.write(data)
+    if not pinned:
+        sums[filename] = digest
+        print(f"📌 Pinned {filename}: sha256 {digest} (new pin - review before committing)")
+    print(f"✅ Vendored: {path} ({len(data) // 1024} KB)")
+    return path
+
+
+def problems():
+    """Human-readable list of vendored files that are missing, unpinned or don't match their pin"""
+    sums = load_sums()
+    found = []
+    for filename in VENDORED:
+        path = os.path.join(VENDOR_DIR, filename)
+        if not os.path.exists(path):
+            found.append(f"static/vendor/{filename} is missing (run python vendor_assets.py and commit it)")
+        elif filename not in sums:
+            found.append(f"static/vendor/{filename} has no pin in SHA256SUMS")
+        else:
+            with open(path, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            if digest != sums[filename]:
+                found.append(f"static/vendor/{filename} does not match its pinned sha256")
+    return found
+
+
+def main():
+    if '--check' in sys.argv[1:]:
+        found = problems()
+        for problem in found:
+            print(f"❌ {problem}")
+        sys.exit(1 if found else 0)
+
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    sums = load_sums()
+    for filename, url in VENDORED.items():
+        vendor(filename, url, sums)
+    save_sums(sums)
+
+
+if __name__ == '__main__':
+    main()
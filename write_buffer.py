@@ -0,0 +1,205 @@
+"""
+Group-commit write buffer for the roadshow CSV files
+Batches writes from concurrent requests into one flush every few milliseconds,
+guarded by an fcntl lock so multiple gunicorn workers never interleave rows.
+"""
+import csv
+import io
+import os
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+
+# fcntl is POSIX only - on Windows (local dev) we fall back to in-process locking
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+# Tunables (set in Render Environment)
+WRITE_BATCH_INTERVAL_MS = float(os.environ.get('WRITE_BATCH_INTERVAL_MS', '5'))
+WRITE_FSYNC = os.environ.get('WRITE_FSYNC', '1') == '1'
+
+
+@contextmanager
+def file_lock(path, shared=False):
+    """Hold a cross-process lock on `path` (via a sidecar .lock file)"""
+    if fcntl is None:
+        # Single process only - shared and exclusive both take the same lock
+        with _local_locks_guard:
+            lock = _local_locks.setdefault(os.path.abspath(path), threading.RLock())
+        with lock:
+            yield
+        return
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def atomic_write(path, fsync=WRITE_FSYNC):
+    """
+    Text file to rewrite `path` with - it replaces `path` only once fully written
+    (and fsynced), so a crash mid-rewrite leaves the previous version intact.
+    """
+    tmp = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp, 'w', newline='') as f:
+            yield f
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def tail_rows(path, offset, lock=True):
+    """
+    CSV rows appended to `path` since byte `offset`, and the new offset.
+    Only complete lines are consumed. Returns (None, 0) if the file shrank (it was reset).
+    """
+    if not os.path.exists(path):
+        return [], offset
+    with (file_lock(path, shared=True) if lock else nullcontext()), open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < offset:
+            return None, 0
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b'\n') + 1
+    if not end:
+        return [], offset
+    return list(csv.reader(io.StringIO(data[:end].decode('utf-8')))), offset + end
+
+
+class GroupCommitWriter:
+    """
+    Collects pending writes and commits them in batches.
+
+    Callers block until their batch has been written (and fsynced when
+    enabled), so a write is durable once the request returns.
+    """
+
+    def __init__(self, interval_ms=WRITE_BATCH_INTERVAL_MS, fsync=WRITE_FSYNC):
+        self.interval = interval_ms / 1000.0
+        self.fsync = fsync
+        self._pending = {}  # path -> list of (kind, payload, future)
+        self._cond = threading.Condition()
+        self._thread = None
+        self._pid = None
+
+    def append_rows(self, path, rows, wait=True):
+        """
+        Append CSV rows to `path`; returns the (start, end) byte offsets they were written at.
+        With wait=False returns the Future instead, so the caller can put other writes in the same batch.
+        """
+        return self._submit(path, 'append', list(rows), wait)
+
+    def update(self, path, func):
+        """Run func(path) under the file lock as part of the next batch (read-modify-write)"""
+        return self._submit(path, 'update', func)
+
+    def _submit(self, path, kind, payload, wait=True):
+        future = Future()
+        with self._cond:
+            self._ensure_flusher()
+            self._pending.setdefault(path, []).append((kind, payload, future))
+            self._cond.notify()
+        return future.result() if wait else future
+
+    def _ensure_flusher(self):
+        # Threads don't survive fork, so (re)start lazily in each gunicorn worker
+        if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='group-commit', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            # Let concurrent requests join this batch
+            time.sleep(self.interval)
+            with self._cond:
+                batch, self._pending = self._pending, {}
+            for path, ops in batch.items():
+                try:
+                    self._commit(path, ops)
+                except Exception as e:
+                    # e.g. the lock file can't be opened - fail these writes, keep flushing others
+                    for _, _, future in ops:
+                        if not future.done():
+                            future.set_exception(e)
+
+    def _commit(self, path, ops):
+        with file_lock(path):
+            i = 0
+            while i < len(ops):
+                kind, payload, future = ops[i]
+                if kind == 'append':
+                    # Coalesce consecutive appends into a single write
+                    group = [ops[i]]
+                    while i + 1 < len(ops) and ops[i + 1][0] == 'append':
+                        i += 1
+                        group.append(ops[i])
+                    self._apply_appends(path, group)
+                else:
+                    try:
+                        future.set_result(self._sync_after(path, payload(path)))
+                    except Exception as e:
+                        future.set_exception(e)
+                i += 1
+
+    def _apply_appends(self, path, group):
+        try:
+            spans = []
+            chunks = []
+            # Unbuffered, so nothing can reach the file after a failed write has been rolled back
+            with open(path, 'ab', buffering=0) as f:
+                start = offset = os.fstat(f.fileno()).st_size
+                for _, rows, _ in group:
+                    buffer = io.StringIO()
+                    csv.writer(buffer).writerows(rows)
+                    data = buffer.getvalue().encode('utf-8')
+                    chunks.append(data)
+                    spans.append((offset, offset + len(data)))
+                    offset += len(data)
+                try:
+                    data = memoryview(b''.join(chunks))
+                    while data:
+                        data = data[f.write(data):]
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                except Exception:
+                    # Drop the partial rows so the next batch doesn't append after a torn line
+                    os.ftruncate(f.fileno(), start)
+                    raise
+        except Exception as e:
+            for _, _, future in group:
+                future.set_exception(e)
+            return
+        for (_, _, future), span in zip(group, spans):
+            future.set_result(span)
+
+    def _sync_after(self, path, result):
+        if self.fsync and os.path.exists(path):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        return result
+
+
+# Shared writer used by app.py
+writer = GroupCommitWriter()